@@ -17,7 +17,13 @@ from jciphers.substitution import (
     encrypt_vigenere,
 )
 from jciphers.transposition import decrypt_rail_fence, encrypt_rail_fence
-from util import option_selection, terminal_clear, validate_key, validate_message
+from util import (
+    banner,
+    option_selection,
+    terminal_clear,
+    validate_key,
+    validate_message,
+)
 
 __all__ = [
     "CaesarShiftCipher",
@@ -52,6 +58,14 @@ class VigenereCipherMessage:
 
 
 class CaesarShiftCipher:
+    title = "Caesar Shift Cipher"
+    function_options = [
+        "Encrypt Caesar shift",
+        "Decrypt Caesar shift",
+        "Display last fifteen results",
+        "Quit",
+    ]
+
     def __init__(self):
         self.last_fifteen_messages = []
 
@@ -81,7 +95,8 @@ class CaesarShiftCipher:
                     return
                 terminal_clear()
                 self.intro()
-            except (UnsupportedKeyError, UnsupportedMessageError):
+            except (UnsupportedKeyError, UnsupportedMessageError) as error:
+                print(error)
                 continue
 
     def decrypt(self) -> str:
@@ -97,11 +112,7 @@ class CaesarShiftCipher:
         print(f"Your decrypted message is: {decrypted_message}")
 
     def display_last_fifteen_messages(self) -> None:
-        print("#. MESSAGE | SHIFTS")
-        if len(self.last_fifteen_messages) == 0:
-            print("No entries.")
-        for index, message in enumerate(self.last_fifteen_messages):
-            print(f"{index + 1}. {message.message} | {message.shifts}")
+        print(self.format_last_fifteen_messages())
 
     def encrypt(self) -> str:
         # TODO: Format input message, removing spaces, punctuation, and unsupported characters.
@@ -115,25 +126,22 @@ class CaesarShiftCipher:
         self.cache_message(encrypted_message, shifts)
         print(f"Your encrypted message is: {encrypted_message}")
 
+    def format_last_fifteen_messages(self) -> str:
+        lines = ["#. MESSAGE | SHIFTS"]
+        if len(self.last_fifteen_messages) == 0:
+            lines.append("No entries.")
+        for index, message in enumerate(self.last_fifteen_messages):
+            lines.append(f"{index + 1}. {message.message} | {message.shifts}")
+        return "\n".join(lines)
+
     def intro(self):
         terminal_clear()
         # TODO: Explain Caesar shift ciphers.
-        print(
-            """===================
-Caesar Shift Cipher
-===================
-"""
-        )
+        print(banner(self.title))
 
     def prompt_cipher_functions(self) -> int:
         choice_index = option_selection(
-            "Choose a function:",
-            options=[
-                "Encrypt Caesar shift",
-                "Decrypt Caesar shift",
-                "Display last fifteen results",
-                "Quit",
-            ],
+            "Choose a function:", options=self.function_options
         )
         return choice_index
 
@@ -151,6 +159,14 @@ Caesar Shift Cipher
 
 
 class MlecchitaVikaalpaRomanCipher:
+    title = "Mlecchita Vikaalpa Cipher"
+    function_options = [
+        "Encrypt Mlecchita Vikaalpa (Roman)",
+        "Decrypt Mlecchita Vikaalpa (Roman)",
+        "Display last fifteen results",
+        "Quit",
+    ]
+
     def __init__(self):
         self.last_fifteen_messages = []
 
@@ -182,7 +198,8 @@ class MlecchitaVikaalpaRomanCipher:
                     return
                 terminal_clear()
                 self.intro()
-            except (UnsupportedKeyError, UnsupportedMessageError):
+            except (UnsupportedKeyError, UnsupportedMessageError) as error:
+                print(error)
                 continue
 
     def decrypt(self) -> str:
@@ -198,11 +215,7 @@ class MlecchitaVikaalpaRomanCipher:
         print(f"Your decrypted message is: {decrypted_message}")
 
     def display_last_fifteen_messages(self) -> None:
-        print("#. MESSAGE")
-        if len(self.last_fifteen_messages) == 0:
-            print("No entries.")
-        for index, message in enumerate(self.last_fifteen_messages):
-            print(f"{index + 1}. {message.message}")
+        print(self.format_last_fifteen_messages())
 
     def encrypt(self) -> str:
         # TODO: Format input message, removing spaces, punctuation, and unsupported characters.
@@ -215,30 +228,35 @@ class MlecchitaVikaalpaRomanCipher:
         print(f"Generated cipher alphabet: {cipher_alphabet}")
         print(f"Your encrypted message is: {encrypted_message}")
 
+    def format_last_fifteen_messages(self) -> str:
+        lines = ["#. MESSAGE"]
+        if len(self.last_fifteen_messages) == 0:
+            lines.append("No entries.")
+        for index, message in enumerate(self.last_fifteen_messages):
+            lines.append(f"{index + 1}. {message.message}")
+        return "\n".join(lines)
+
     def intro(self):
         terminal_clear()
         # TODO: Explain Mlecchita Vikaalpa ciphers.
-        print(
-            """=========================
-Mlecchita Vikaalpa Cipher
-=========================
-"""
-        )
+        print(banner(self.title))
 
     def prompt_cipher_functions(self) -> int:
         choice_index = option_selection(
-            "Choose a function:",
-            options=[
-                "Encrypt Mlecchita Vikaalpa (Roman)",
-                "Decrypt Mlecchita Vikaalpa (Roman)",
-                "Display last fifteen results",
-                "Quit",
-            ],
+            "Choose a function:", options=self.function_options
         )
         return choice_index
 
 
 class RailFenceCipher:
+    title = "Rail Fence Cipher"
+    function_options = [
+        "Encrypt rail fence",
+        "Decrypt rail fence",
+        "Display last fifteen results",
+        "Quit",
+    ]
+
     def __init__(self):
         self.last_fifteen_messages = []
 
@@ -268,7 +286,8 @@ class RailFenceCipher:
                     return
                 terminal_clear()
                 self.intro()
-            except (UnsupportedKeyError, UnsupportedMessageError):
+            except (UnsupportedKeyError, UnsupportedMessageError) as error:
+                print(error)
                 continue
 
     def decrypt(self) -> str:
@@ -283,11 +302,7 @@ class RailFenceCipher:
         print(f"Your decrypted message is: {decrypted_message}")
 
     def display_last_fifteen_messages(self) -> None:
-        print("#. MESSAGE | LEVELS")
-        if len(self.last_fifteen_messages) == 0:
-            print("No entries.")
-        for index, message in enumerate(self.last_fifteen_messages):
-            print(f"{index + 1}. {message.message} | {message.levels}")
+        print(self.format_last_fifteen_messages())
 
     def encrypt(self) -> str:
         # TODO: Format input message, removing spaces, punctuation, and unsupported characters.
@@ -300,25 +315,22 @@ class RailFenceCipher:
         self.cache_message(encrypted_message, levels)
         print(f"Your encrypted message is: {encrypted_message}")
 
+    def format_last_fifteen_messages(self) -> str:
+        lines = ["#. MESSAGE | LEVELS"]
+        if len(self.last_fifteen_messages) == 0:
+            lines.append("No entries.")
+        for index, message in enumerate(self.last_fifteen_messages):
+            lines.append(f"{index + 1}. {message.message} | {message.levels}")
+        return "\n".join(lines)
+
     def intro(self):
         terminal_clear()
         # TODO: Explain rail fence ciphers.
-        print(
-            """=================
-Rail Fence Cipher
-=================
-"""
-        )
+        print(banner(self.title))
 
     def prompt_cipher_functions(self) -> int:
         choice_index = option_selection(
-            "Choose a function:",
-            options=[
-                "Encrypt rail fence",
-                "Decrypt rail fence",
-                "Display last fifteen results",
-                "Quit",
-            ],
+            "Choose a function:", options=self.function_options
         )
         return choice_index
 
@@ -338,6 +350,14 @@ Rail Fence Cipher
 
 
 class VigenereCipher:
+    title = "Vigenère Cipher"
+    function_options = [
+        "Encrypt Vigenère",
+        "Decrypt Vigenère",
+        "Display last fifteen results",
+        "Quit",
+    ]
+
     def __init__(self):
         self.last_fifteen_messages = []
 
@@ -367,7 +387,8 @@ class VigenereCipher:
                     return
                 terminal_clear()
                 self.intro()
-            except (UnsupportedKeyError, UnsupportedMessageError):
+            except (UnsupportedKeyError, UnsupportedMessageError) as error:
+                print(error)
                 continue
 
     def decrypt(self) -> str:
@@ -384,11 +405,7 @@ class VigenereCipher:
         print(f"Your decrypted message is: {decrypted_message}")
 
     def display_last_fifteen_messages(self) -> None:
-        print("#. MESSAGE | KEY")
-        if len(self.last_fifteen_messages) == 0:
-            print("No entries.")
-        for index, message in enumerate(self.last_fifteen_messages):
-            print(f"{index + 1}. {message.message} | {message.key}")
+        print(self.format_last_fifteen_messages())
 
     def encrypt(self) -> str:
         # TODO: Format input message, removing spaces, punctuation, and unsupported characters.
@@ -403,24 +420,21 @@ class VigenereCipher:
         self.cache_message(encrypted_message, key)
         print(f"Your encrypted message is: {encrypted_message}")
 
+    def format_last_fifteen_messages(self) -> str:
+        lines = ["#. MESSAGE | KEY"]
+        if len(self.last_fifteen_messages) == 0:
+            lines.append("No entries.")
+        for index, message in enumerate(self.last_fifteen_messages):
+            lines.append(f"{index + 1}. {message.message} | {message.key}")
+        return "\n".join(lines)
+
     def intro(self):
         terminal_clear()
         # TODO: Explain Vigenere ciphers.
-        print(
-            """===============
-Vigenère Cipher
-===============
-"""
-        )
+        print(banner(self.title))
 
     def prompt_cipher_functions(self) -> int:
         choice_index = option_selection(
-            "Choose a function:",
-            options=[
-                "Encrypt Vigenère",
-                "Decrypt Vigenère",
-                "Display last fifteen results",
-                "Quit",
-            ],
+            "Choose a function:", options=self.function_options
         )
         return choice_index
@@ -0,0 +1,165 @@
+"""Streaming frequency analysis."""
+import math
+import string
+import sys
+from array import array
+
+__all__ = [
+    "FrequencyCounter",
+    "analyse_file",
+]
+
+_LETTERS = string.ascii_uppercase.encode()
+_NON_LETTERS = bytes(
+    byte for byte in range(256) if chr(byte) not in string.ascii_letters
+)
+_UPPERCASE_TABLE = bytes.maketrans(string.ascii_lowercase.encode(), _LETTERS)
+_CODE_TABLE = bytes.maketrans(_LETTERS, bytes(range(26)))
+
+
+class FrequencyCounter:
+    """Unigram, bigram and trigram counts over a message read in chunks.
+
+    Only Latin letters are counted; everything else is dropped before counting,
+    so n-grams span spaces and punctuation the same way formatted cipher strings
+    do. Counters built over consecutive parts of a message can be merged in
+    order, which allows the parts to be counted in parallel.
+
+    Trigram codes of a chunk are computed with integer arithmetic on packed
+    16-bit lanes and counted into a flat array. Every bigram except the last one
+    starts a trigram, so bigram counts are derived from the trigram counts.
+    """
+
+    def __init__(self):
+        self.length = 0
+        self.unigram_counts = array("Q", bytes(8 * 26))
+        self.trigram_counts = array("Q", bytes(8 * 26**3))
+        self._head = b""
+        self._tail = b""
+
+    @property
+    def bigram_counts(self) -> array:
+        counts = array(
+            "Q",
+            (sum(self.trigram_counts[row : row + 26]) for row in range(0, 26**3, 26)),
+        )
+        if len(self._tail) == 2:
+            first, second = self._tail.translate(_CODE_TABLE)
+            counts[first * 26 + second] += 1
+        return counts
+
+    def copy(self) -> "FrequencyCounter":
+        counter = FrequencyCounter()
+        counter.length = self.length
+        counter.unigram_counts = array("Q", self.unigram_counts)
+        counter.trigram_counts = array("Q", self.trigram_counts)
+        counter._head = self._head
+        counter._tail = self._tail
+        return counter
+
+    def entropy(self) -> float:
+        """Shannon entropy of the unigrams in bits per letter."""
+        if self.length == 0:
+            return 0.0
+        entropy = 0.0
+        for count in self.unigram_counts:
+            if count:
+                probability = count / self.length
+                entropy -= probability * math.log2(probability)
+        return entropy
+
+    def index_of_coincidence(self) -> float:
+        if self.length < 2:
+            return 0.0
+        coincidences = sum(count * (count - 1) for count in self.unigram_counts)
+        return coincidences / (self.length * (self.length - 1))
+
+    def merge(self, other: "FrequencyCounter") -> "FrequencyCounter":
+        """Combines counts as if the other message directly followed this one."""
+        counter = self.copy()
+        for index, value in enumerate(other.unigram_counts):
+            counter.unigram_counts[index] += value
+        trigram_counts = counter.trigram_counts
+        for index, value in enumerate(other.trigram_counts):
+            if value:
+                trigram_counts[index] += value
+        window = (self._tail + other._head).translate(_CODE_TABLE)
+        _count_trigrams(window, trigram_counts)
+        counter.length += other.length
+        counter._head = (self._head + other._head)[:2]
+        counter._tail = (self._tail + other._tail)[-2:]
+        return counter
+
+    def most_common(self, size: int = 1, count: int = 10) -> list[tuple[str, int]]:
+        """Returns the most common n-grams of the given size."""
+        if size not in (1, 2, 3):
+            raise ValueError("Only unigrams, bigrams and trigrams are counted.")
+        counts = (self.unigram_counts, self.bigram_counts, self.trigram_counts)[
+            size - 1
+        ]
+        ranked = sorted(
+            (index for index, value in enumerate(counts) if value),
+            key=counts.__getitem__,
+            reverse=True,
+        )
+        return [(_decode_ngram(index, size), counts[index]) for index in ranked[:count]]
+
+    def update(self, chunk: bytes | str) -> None:
+        """Counts the next chunk of the message."""
+        if isinstance(chunk, str):
+            chunk = chunk.encode("ascii", "ignore")
+        letters = chunk.translate(_UPPERCASE_TABLE, _NON_LETTERS)
+        if not letters:
+            return
+        for index, letter in enumerate(_LETTERS):
+            self.unigram_counts[index] += letters.count(letter)
+        # The tail of the previous chunk completes the trigrams across the join.
+        _count_trigrams(
+            (self._tail + letters).translate(_CODE_TABLE), self.trigram_counts
+        )
+        self.length += len(letters)
+        self._head = (self._head + letters)[:2]
+        self._tail = (self._tail + letters)[-2:]
+
+
+def analyse_file(path: str, chunk_size: int = 1 << 20) -> FrequencyCounter:
+    """Counts the letters of a file without reading it into memory at once."""
+    counter = FrequencyCounter()
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            counter.update(chunk)
+    return counter
+
+
+def _count_trigrams(codes: bytes, counts: array) -> None:
+    """Adds the trigrams of a sequence of letter codes (0 to 25) to the counts."""
+    trigram_count = len(codes) - 2
+    if trigram_count < 1:
+        return
+    # Each lane holds at most 25 * 676 + 25 * 26 + 25 = 17575, so lanes never
+    # carry into each other.
+    packed_codes = (
+        _pack_lanes(codes[:trigram_count]) * 676
+        + _pack_lanes(codes[1 : trigram_count + 1]) * 26
+        + _pack_lanes(codes[2:])
+    )
+    trigram_codes = array("H", packed_codes.to_bytes(2 * trigram_count, "little"))
+    if sys.byteorder == "big":
+        trigram_codes.byteswap()
+    for code in trigram_codes:
+        counts[code] += 1
+
+
+def _decode_ngram(index: int, size: int) -> str:
+    letters = ""
+    for _ in range(size):
+        index, code = divmod(index, 26)
+        letters = chr(code + 65) + letters
+    return letters
+
+
+def _pack_lanes(codes: bytes) -> int:
+    """Packs every code into its own little-endian 16-bit lane of one integer."""
+    lanes = bytearray(2 * len(codes))
+    lanes[0::2] = codes
+    return int.from_bytes(lanes, "little")
@@ -0,0 +1,307 @@
+"""Chunked, indexed container format for storing ciphertext.
+
+A container is laid out as::
+
+    header | chunk 0 | chunk 1 | ... | chunk index | footer
+
+The header holds the cipher id, the chunk size and the cipher parameters as
+JSON, followed by its own CRC32. Every chunk holds the ciphertext of
+``chunk_size`` formatted plaintext letters (the last chunk may be shorter). The
+chunk index stores the offset, length and CRC32 of every chunk, and the
+fixed-size footer points at the index and holds the CRC32 of the index and of
+the footer itself, so a single chunk can be read, checked and decrypted without
+reading the rest of the file.
+
+Chunks are encrypted independently: Vigenère keys continue at the key offset of
+the chunk's first letter, so the ciphertext matches encrypting the whole message
+at once, while rail fence transposes each chunk on its own rails.
+
+When an authentication key is given, the footer also holds an HMAC-SHA256 over
+the header, every chunk and the index. CRCs only detect accidental corruption;
+the HMAC detects tampering.
+"""
+import hashlib
+import hmac
+import json
+import struct
+import zlib
+
+from jciphers.helper import format_cipher_string
+from jciphers.substitution import (
+    decrypt_caesar_shift_into,
+    decrypt_general_substitution_with_key_into,
+    decrypt_mlecchita_vikaalpa_roman_into,
+    decrypt_vigenere_into,
+    encrypt_caesar_shift_into,
+    encrypt_general_substitution_with_key_into,
+    encrypt_mlecchita_vikaalpa_roman_into,
+    encrypt_vigenere_into,
+)
+from jciphers.transposition import decrypt_rail_fence_into, encrypt_rail_fence_into
+
+__all__ = [
+    "CAESAR_SHIFT",
+    "DEFAULT_CHUNK_SIZE",
+    "GENERAL_SUBSTITUTION",
+    "MLECCHITA_VIKAALPA_ROMAN",
+    "RAIL_FENCE",
+    "VIGENERE",
+    "ContainerFormatError",
+    "ContainerIntegrityError",
+    "ContainerReader",
+    "write_container",
+]
+
+CAESAR_SHIFT = 1
+GENERAL_SUBSTITUTION = 2
+MLECCHITA_VIKAALPA_ROMAN = 3
+RAIL_FENCE = 4
+VIGENERE = 5
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_VERSION = 1
+_FLAG_AUTHENTICATED = 1
+_HEADER_MAGIC = b"JCPH"
+_FOOTER_MAGIC = b"JCPE"
+_HEADER = struct.Struct("<4sBBBIH")
+_HEADER_CRC = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<QII")
+_FOOTER = struct.Struct("<QII32s")
+_FOOTER_TRAILER = struct.Struct("<I4s")
+
+_CIPHERS = {
+    CAESAR_SHIFT: (encrypt_caesar_shift_into, decrypt_caesar_shift_into, "shifts"),
+    GENERAL_SUBSTITUTION: (
+        encrypt_general_substitution_with_key_into,
+        decrypt_general_substitution_with_key_into,
+        "key",
+    ),
+    MLECCHITA_VIKAALPA_ROMAN: (
+        encrypt_mlecchita_vikaalpa_roman_into,
+        decrypt_mlecchita_vikaalpa_roman_into,
+        "cipher_alphabet",
+    ),
+    RAIL_FENCE: (encrypt_rail_fence_into, decrypt_rail_fence_into, "levels"),
+    VIGENERE: (encrypt_vigenere_into, decrypt_vigenere_into, "key"),
+}
+
+
+class ContainerFormatError(Exception):
+    """The file is not a supported container."""
+
+
+class ContainerIntegrityError(Exception):
+    """A checksum or authentication tag of a container does not match."""
+
+
+class ContainerReader:
+    """Random access to the chunks of a container file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._read_header()
+            self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> "ContainerReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def decrypt(self, executor=None) -> str:
+        """Decrypts every chunk, optionally in parallel on a concurrent.futures executor."""
+        chunks = [self.read_chunk(index) for index in range(self.chunk_count)]
+        arguments = (
+            [self.cipher_id] * self.chunk_count,
+            [self.params] * self.chunk_count,
+            [self.chunk_size] * self.chunk_count,
+            range(self.chunk_count),
+            chunks,
+            [True] * self.chunk_count,
+        )
+        mapper = map if executor is None else executor.map
+        return b"".join(mapper(_transform_chunk, *arguments)).decode()
+
+    def decrypt_chunk(self, chunk_index: int) -> str:
+        """Decrypts only the given chunk."""
+        return _transform_chunk(
+            self.cipher_id,
+            self.params,
+            self.chunk_size,
+            chunk_index,
+            self.read_chunk(chunk_index),
+            True,
+        ).decode()
+
+    def read_chunk(self, chunk_index: int) -> bytes:
+        """Reads the ciphertext of a chunk and checks its CRC."""
+        offset, length, crc = self._index[chunk_index]
+        self._file.seek(offset)
+        data = self._file.read(length)
+        if len(data) != length or zlib.crc32(data) != crc:
+            raise ContainerIntegrityError(f"Chunk {chunk_index} is corrupted.")
+        return data
+
+    def verify(self, auth_key: bytes | None = None) -> None:
+        """Checks every chunk CRC and, given a key, the authentication tag."""
+        if auth_key is not None and not self.authenticated:
+            raise ContainerIntegrityError("The container has no authentication tag.")
+        mac = hmac.new(auth_key, digestmod=hashlib.sha256) if auth_key else None
+        if mac is not None:
+            mac.update(self._header_bytes)
+        for chunk_index in range(self.chunk_count):
+            data = self.read_chunk(chunk_index)
+            if mac is not None:
+                mac.update(data)
+        if mac is not None:
+            mac.update(self._index_bytes)
+            if not hmac.compare_digest(mac.digest(), self._tag):
+                raise ContainerIntegrityError("The authentication tag does not match.")
+
+    def _read_header(self) -> None:
+        header = self._file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ContainerFormatError("The file is too short to be a container.")
+        magic, version, flags, cipher_id, chunk_size, params_length = _HEADER.unpack(
+            header
+        )
+        if magic != _HEADER_MAGIC:
+            raise ContainerFormatError("The file is not a jciphers container.")
+        if version != _VERSION:
+            raise ContainerFormatError(f"Unsupported container version: {version}.")
+        if cipher_id not in _CIPHERS:
+            raise ContainerFormatError(f"Unsupported cipher id: {cipher_id}.")
+        params = self._file.read(params_length)
+        header_crc = self._file.read(_HEADER_CRC.size)
+        if len(params) != params_length or len(header_crc) != _HEADER_CRC.size:
+            raise ContainerFormatError("The container header is truncated.")
+        self._header_bytes = header + params
+        if zlib.crc32(self._header_bytes) != _HEADER_CRC.unpack(header_crc)[0]:
+            raise ContainerIntegrityError("The container header is corrupted.")
+        self.authenticated = bool(flags & _FLAG_AUTHENTICATED)
+        self.cipher_id = cipher_id
+        self.chunk_size = chunk_size
+        try:
+            self.params = json.loads(params)
+        except ValueError as error:
+            raise ContainerFormatError("The cipher parameters are not JSON.") from error
+        self._data_offset = self._file.tell()
+
+    def _read_index(self) -> None:
+        footer_offset = self._file.seek(0, 2) - _FOOTER.size - _FOOTER_TRAILER.size
+        if footer_offset < self._data_offset:
+            raise ContainerFormatError("The container footer is missing.")
+        self._file.seek(footer_offset)
+        footer = self._file.read(_FOOTER.size)
+        footer_crc, magic = _FOOTER_TRAILER.unpack(
+            self._file.read(_FOOTER_TRAILER.size)
+        )
+        if magic != _FOOTER_MAGIC:
+            raise ContainerFormatError("The container footer is missing.")
+        if zlib.crc32(footer) != footer_crc:
+            raise ContainerIntegrityError("The container footer is corrupted.")
+        index_offset, chunk_count, index_crc, self._tag = _FOOTER.unpack(footer)
+        index_length = chunk_count * _INDEX_ENTRY.size
+        if (
+            index_offset < self._data_offset
+            or index_offset + index_length != footer_offset
+        ):
+            raise ContainerIntegrityError("The chunk index is out of bounds.")
+        self._file.seek(index_offset)
+        self._index_bytes = self._file.read(index_length)
+        if len(self._index_bytes) != index_length:
+            raise ContainerIntegrityError("The chunk index is truncated.")
+        if zlib.crc32(self._index_bytes) != index_crc:
+            raise ContainerIntegrityError("The chunk index is corrupted.")
+        self._index = list(_INDEX_ENTRY.iter_unpack(self._index_bytes))
+        for chunk_index, (offset, length, _) in enumerate(self._index):
+            if offset < self._data_offset or offset + length > index_offset:
+                raise ContainerIntegrityError(f"Chunk {chunk_index} is out of bounds.")
+
+
+def write_container(
+    path: str,
+    message: str,
+    cipher_id: int,
+    params: dict,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    auth_key: bytes | None = None,
+) -> int:
+    """Encrypts a message into a container file and returns the number of chunks.
+
+    The params hold the key of the cipher under the same name as its interactive
+    message cache: shifts, key, cipher_alphabet or levels.
+    """
+    if cipher_id not in _CIPHERS:
+        raise ContainerFormatError(f"Unsupported cipher id: {cipher_id}.")
+    if chunk_size < 1 or chunk_size >= 1 << 32:
+        raise ValueError("The chunk size must be between 1 and 2**32 - 1 letters.")
+    encoded_params = json.dumps(params).encode()
+    if len(encoded_params) > 0xFFFF:
+        raise ValueError("The cipher parameters are longer than 65535 bytes.")
+    plaintext = format_cipher_string(message).encode()
+    flags = _FLAG_AUTHENTICATED if auth_key else 0
+    header = _HEADER.pack(
+        _HEADER_MAGIC, _VERSION, flags, cipher_id, chunk_size, len(encoded_params)
+    )
+    header += encoded_params
+    mac = hmac.new(auth_key, header, hashlib.sha256) if auth_key else None
+    index = bytearray()
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(_HEADER_CRC.pack(zlib.crc32(header)))
+        for chunk_index, start in enumerate(range(0, len(plaintext), chunk_size)):
+            data = _transform_chunk(
+                cipher_id,
+                params,
+                chunk_size,
+                chunk_index,
+                plaintext[start : start + chunk_size],
+                False,
+            )
+            index += _INDEX_ENTRY.pack(file.tell(), len(data), zlib.crc32(data))
+            file.write(data)
+            if mac is not None:
+                mac.update(data)
+        index_offset = file.tell()
+        file.write(index)
+        if mac is not None:
+            mac.update(index)
+        tag = mac.digest() if mac is not None else bytes(32)
+        chunk_count = len(index) // _INDEX_ENTRY.size
+        footer = _FOOTER.pack(index_offset, chunk_count, zlib.crc32(index), tag)
+        file.write(footer)
+        file.write(_FOOTER_TRAILER.pack(zlib.crc32(footer), _FOOTER_MAGIC))
+    return chunk_count
+
+
+def _transform_chunk(
+    cipher_id: int,
+    params: dict,
+    chunk_size: int,
+    chunk_index: int,
+    data: bytes,
+    decrypt: bool,
+) -> bytes:
+    """Encrypts or decrypts one chunk; module-level so process pools can pickle it."""
+    encrypt_into, decrypt_into, param_name = _CIPHERS[cipher_id]
+    key = params[param_name]
+    if cipher_id == VIGENERE:
+        key = format_cipher_string(key)
+        offset = chunk_index * chunk_size % len(key)
+        key = key[offset:] + key[:offset]
+    buffer = bytearray(len(data))
+    (decrypt_into if decrypt else encrypt_into)(data, buffer, key)
+    return bytes(buffer)
@@ -1,8 +1,11 @@
 """Helper functions."""
+import ctypes
 
 __all__ = [
     "UnsupportedKeyError",
     "UnsupportedMessageError",
+    "buffer_address",
+    "buffers_overlap",
     "format_cipher_string",
 ]
 
@@ -15,5 +18,45 @@ class UnsupportedMessageError(Exception):
     """Unsupported message format received."""
 
 
+class _PyBuffer(ctypes.Structure):
+    """The C Py_buffer struct filled in by PyObject_GetBuffer."""
+
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.c_void_p),
+        ("strides", ctypes.c_void_p),
+        ("suboffsets", ctypes.c_void_p),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+def buffer_address(buffer) -> int:
+    """Returns the memory address of the first byte of a buffer, read-only or not."""
+    view = _PyBuffer()
+    ctypes.pythonapi.PyObject_GetBuffer(ctypes.py_object(buffer), ctypes.byref(view), 0)
+    try:
+        return view.buf
+    finally:
+        ctypes.pythonapi.PyBuffer_Release(ctypes.byref(view))
+
+
+def buffers_overlap(first: memoryview, second: memoryview) -> bool:
+    """Checks whether two contiguous buffers share any bytes of memory."""
+    if not first.nbytes or not second.nbytes:
+        return False
+    first_start = buffer_address(first)
+    second_start = buffer_address(second)
+    return (
+        first_start < second_start + second.nbytes
+        and second_start < first_start + first.nbytes
+    )
+
+
 def format_cipher_string(message: str) -> str:
     return message.replace(" ", "").upper()
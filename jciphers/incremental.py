@@ -0,0 +1,185 @@
+"""Incremental re-encryption for documents that change between calls.
+
+Substitution ciphers split the formatted message into fixed-size blocks. Each
+block keeps a content hash and, for Vigenère, the key offset at its boundary, so
+a later call only re-encrypts blocks whose content or offset changed and splices
+them into the previous output. Position-independent ciphers such as the Caesar
+shift always use a key offset of 0.
+
+The rail fence cipher writes character ``i`` to rail ``i % levels``. An edit that
+keeps the message length only touches the rails of the indexes between the
+shared prefix and the shared suffix, and an append touches at most ``levels``
+rails starting at ``len(previous_message) % levels``. Inserts, deletes and
+truncations shift every later character, so they touch every rail unless they
+are within ``levels`` characters of the end. Only the touched rails are
+recomputed.
+"""
+import hashlib
+from dataclasses import dataclass, field
+
+from jciphers.helper import format_cipher_string
+from jciphers.polyalphabetic import KeySchedule
+from jciphers.substitution import (
+    _validate_shifts,
+    encrypt_caesar_shift,
+    encrypt_vigenere,
+)
+
+__all__ = [
+    "DEFAULT_BLOCK_SIZE",
+    "IncrementalState",
+    "RailFenceState",
+    "encrypt_caesar_shift_incremental",
+    "encrypt_rail_fence_incremental",
+    "encrypt_vigenere_incremental",
+]
+
+DEFAULT_BLOCK_SIZE = 4096
+
+
+@dataclass
+class IncrementalState:
+    """Per-block state of a previous substitution encryption."""
+
+    key: int | str
+    block_size: int = DEFAULT_BLOCK_SIZE
+    block_hashes: list[bytes] = field(default_factory=list)
+    key_offsets: list[int] = field(default_factory=list)
+    encrypted_blocks: list[str] = field(default_factory=list)
+
+    @property
+    def encrypted_message(self) -> str:
+        return "".join(self.encrypted_blocks)
+
+
+@dataclass
+class RailFenceState:
+    """Rails of a previous rail fence encryption."""
+
+    levels: int
+    message: str = ""
+    rails: list[str] = field(default_factory=list)
+
+    @property
+    def encrypted_message(self) -> str:
+        return "".join(self.rails)
+
+
+def encrypt_caesar_shift_incremental(
+    message: str,
+    shifts: int,
+    state: IncrementalState | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[str, IncrementalState]:
+    """Encrypts a Caesar shift, re-using unchanged blocks from a previous state."""
+    _validate_shifts(shifts)
+    if state is None or state.key != shifts or state.block_size != block_size:
+        state = IncrementalState(shifts, block_size)
+    _encrypt_blocks(
+        format_cipher_string(message),
+        state,
+        lambda block, _: encrypt_caesar_shift(block, shifts),
+        1,
+    )
+    return state.encrypted_message, state
+
+
+def encrypt_rail_fence_incremental(
+    message: str, levels: int, state: RailFenceState | None = None
+) -> tuple[str, RailFenceState]:
+    """Encrypts a rail fence, recomputing only the rails touched since a previous state."""
+    message = message.replace(" ", "").upper()
+    if state is None or state.levels != levels:
+        state = RailFenceState(levels, "", [""] * levels)
+    previous_message = state.message
+    first_change = _common_prefix_length(previous_message, message)
+    last_index = max(len(previous_message), len(message))
+    if len(previous_message) == len(message):
+        last_index -= _common_suffix_length(
+            previous_message[first_change:], message[first_change:]
+        )
+    if last_index - first_change >= levels:
+        affected_rails = range(levels)
+    else:
+        affected_rails = {index % levels for index in range(first_change, last_index)}
+    for rail in affected_rails:
+        state.rails[rail] = message[rail::levels]
+    state.message = message
+    return state.encrypted_message, state
+
+
+def encrypt_vigenere_incremental(
+    message: str,
+    key: str,
+    state: IncrementalState | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[str, IncrementalState]:
+    """Encrypts a Vigenère cipher, re-using unchanged blocks from a previous state."""
+    key = format_cipher_string(key)
+    # Rejects empty keys and non-letters before the key length is used.
+    KeySchedule(key)
+    if state is None or state.key != key or state.block_size != block_size:
+        state = IncrementalState(key, block_size)
+    _encrypt_blocks(
+        format_cipher_string(message),
+        state,
+        lambda block, offset: encrypt_vigenere(block, key[offset:] + key[:offset]),
+        len(key),
+    )
+    return state.encrypted_message, state
+
+
+def _common_prefix_length(previous: str, current: str) -> int:
+    """Finds the length of the shared prefix using slice comparisons."""
+    if current.startswith(previous):
+        return len(previous)
+    low = 0
+    high = min(len(previous), len(current))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if previous[low:middle] == current[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(previous: str, current: str) -> int:
+    """Finds the length of the shared suffix of two equally long strings."""
+    end = len(current)
+    low = 0
+    high = end
+    while low < high:
+        middle = (low + high + 1) // 2
+        if previous[end - middle : end - low] == current[end - middle : end - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _encrypt_blocks(message, state, encrypt_block, key_length) -> None:
+    """Re-encrypts changed blocks of a formatted message into the state."""
+    block_size = state.block_size
+    block_count = -(-len(message) // block_size)
+    for block_index in range(block_count):
+        start = block_index * block_size
+        block = message[start : start + block_size]
+        block_hash = hashlib.blake2b(block.encode(), digest_size=16).digest()
+        key_offset = start % key_length
+        if block_index < len(state.block_hashes):
+            if (
+                state.block_hashes[block_index] == block_hash
+                and state.key_offsets[block_index] == key_offset
+            ):
+                continue
+            state.block_hashes[block_index] = block_hash
+            state.key_offsets[block_index] = key_offset
+            state.encrypted_blocks[block_index] = encrypt_block(block, key_offset)
+        else:
+            state.block_hashes.append(block_hash)
+            state.key_offsets.append(key_offset)
+            state.encrypted_blocks.append(encrypt_block(block, key_offset))
+    del state.block_hashes[block_count:]
+    del state.key_offsets[block_count:]
+    del state.encrypted_blocks[block_count:]
@@ -0,0 +1,198 @@
+"""Bulk storage of random Mlecchita Vikaalpa cipher alphabets."""
+import functools
+import mmap
+import random
+import secrets
+import string
+
+__all__ = ["MlecchitaKeyStore"]
+
+_LETTERS = string.ascii_uppercase.encode()
+_ROW_SIZE = len(_LETTERS)
+_BATCH_SIZE = 1 << 14
+# Sort keys are 64-bit lanes: the lowest byte holds the letter, the top bit is
+# left clear for the comparison borrow, and the 55 bits between are random.
+_KEY_SIZE = 8
+_CLEAR_TOP_BIT = bytes(byte & 0x7F for byte in range(256))
+# Byte k of the table maps a letter to byte k of its 32-bit presence bit.
+_PRESENCE_TABLES = [
+    bytes(
+        (1 << (byte - 65)) >> (8 * index) & 0xFF if byte in _LETTERS else 0
+        for byte in range(256)
+    )
+    for index in range(4)
+]
+_ALL_LETTERS_PRESENT = ((1 << _ROW_SIZE) - 1).to_bytes(4, "little")
+
+
+class MlecchitaKeyStore:
+    """Cipher alphabets stored as 26-byte rows, one row per record id.
+
+    The rows live in a bytearray or in a memory-mapped file, so a store of a
+    million alphabets takes 26 MB and no per-record objects. Lookups slice the
+    row of a record id directly. Every row is checked to be a permutation of the
+    alphabet when the store is created.
+    """
+
+    def __init__(self, buffer, mapped_file=None):
+        if len(buffer) % _ROW_SIZE:
+            raise ValueError("The key store size is not a multiple of 26 bytes.")
+        batch_size = _BATCH_SIZE * _ROW_SIZE
+        for start in range(0, len(buffer), batch_size):
+            if not _are_permutations(buffer[start : start + batch_size]):
+                raise ValueError("The key store holds a row that is not an alphabet.")
+        self._buffer = buffer
+        self._mapped_file = mapped_file
+
+    def __enter__(self) -> "MlecchitaKeyStore":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._buffer) // _ROW_SIZE
+
+    @classmethod
+    def generate(
+        cls, count: int, seed: int | None = None, path: str | None = None
+    ) -> "MlecchitaKeyStore":
+        """Generates random alphabets, in a memory-mapped file if a path is given.
+
+        Without a seed the randomness comes from the secrets module; a seed makes
+        the alphabets reproducible and is only meant for tests.
+        """
+        if seed is None:
+            randbytes = secrets.token_bytes
+        else:
+            randbytes = random.Random(seed).randbytes
+        batches = (
+            _generate_rows(min(_BATCH_SIZE, count - start), randbytes)
+            for start in range(0, count, _BATCH_SIZE)
+        )
+        if path is None:
+            return cls(bytearray().join(batches))
+        with open(path, "wb") as file:
+            file.writelines(batches)
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str) -> "MlecchitaKeyStore":
+        """Memory-maps a key store file read-only."""
+        file = open(path, "rb")
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped.
+            buffer = b""
+        try:
+            return cls(buffer, file)
+        except ValueError:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+            file.close()
+            raise
+
+    def cipher_alphabet(self, record_id: int) -> str:
+        """Returns the alphabet of a record, as accepted by the Mlecchita functions."""
+        return self._row(record_id).decode()
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._mapped_file is not None:
+            self._mapped_file.close()
+
+    def forward_table(self, record_id: int) -> bytes:
+        """Returns a bytes.translate table that encrypts with the record's alphabet."""
+        return bytes.maketrans(_LETTERS, self._row(record_id))
+
+    def inverse_table(self, record_id: int) -> bytes:
+        """Returns a bytes.translate table that decrypts with the record's alphabet."""
+        return bytes.maketrans(self._row(record_id), _LETTERS)
+
+    def _row(self, record_id: int) -> bytes:
+        if record_id < 0 or record_id >= len(self):
+            raise IndexError(f"No key stored for record {record_id}.")
+        start = record_id * _ROW_SIZE
+        return bytes(self._buffer[start : start + _ROW_SIZE])
+
+
+def _are_permutations(rows: bytes) -> bool:
+    """Checks that every row holds each letter once, one column at a time.
+
+    Every letter of a column sets its own bit in the 32-bit lane of its row, and
+    a row is a permutation exactly when the lanes of all columns set all 26 bits.
+    """
+    count = len(rows) // _ROW_SIZE
+    lanes = bytearray(4 * count)
+    presence = 0
+    for column in range(_ROW_SIZE):
+        letters = rows[column::_ROW_SIZE]
+        for index, table in enumerate(_PRESENCE_TABLES):
+            lanes[index::4] = letters.translate(table)
+        presence |= int.from_bytes(lanes, "little")
+    return presence == int.from_bytes(_ALL_LETTERS_PRESENT * count, "little")
+
+
+def _generate_rows(count: int, randbytes) -> bytearray:
+    """Shuffles count copies of the alphabet by sorting each on random keys.
+
+    Column c of every row starts out as letter c with a random 64-bit sort key,
+    and the column is stored as one integer with a lane per row. A sorting
+    network then compares and swaps whole columns, so every comparison runs over
+    all rows at once instead of once per row. Ties between keys, which happen
+    with probability below 2**-46 per row, are broken by alphabetical order.
+    """
+    column_size = _KEY_SIZE * count
+    keys = bytearray(randbytes(_ROW_SIZE * column_size))
+    keys[_KEY_SIZE - 1 :: _KEY_SIZE] = keys[_KEY_SIZE - 1 :: _KEY_SIZE].translate(
+        _CLEAR_TOP_BIT
+    )
+    keys[::_KEY_SIZE] = b"".join(bytes([letter]) * count for letter in _LETTERS)
+    columns = [
+        int.from_bytes(keys[start : start + column_size], "little")
+        for start in range(0, len(keys), column_size)
+    ]
+    top_bits = int.from_bytes((bytes(_KEY_SIZE - 1) + b"\x80") * count, "little")
+    for low, high in _sorting_network(_ROW_SIZE):
+        first, second = columns[low], columns[high]
+        # The top bit of a lane survives the subtraction when first >= second;
+        # it is then widened to a mask over the whole lane.
+        greater = ((first | top_bits) - second) & top_bits
+        swap = (first ^ second) & ((greater << 1) - (greater >> (8 * _KEY_SIZE - 1)))
+        columns[low] = first ^ swap
+        columns[high] = second ^ swap
+    rows = bytearray(_ROW_SIZE * count)
+    for index, column in enumerate(columns):
+        rows[index::_ROW_SIZE] = column.to_bytes(column_size, "little")[::_KEY_SIZE]
+    return rows
+
+
+@functools.cache
+def _sorting_network(size: int) -> list[tuple[int, int]]:
+    """Comparators of Batcher's odd-even merge sort for size elements.
+
+    The network for the next power of two is built and comparators touching
+    the padding are dropped, which is valid because padding sorts last.
+    """
+    padded_size = 1 << (size - 1).bit_length()
+    comparators = []
+    merge_size = 1
+    while merge_size < padded_size:
+        distance = merge_size
+        while distance:
+            for start in range(
+                distance % merge_size, padded_size - distance, 2 * distance
+            ):
+                for offset in range(min(distance, padded_size - start - distance)):
+                    low = start + offset
+                    high = low + distance
+                    if (
+                        low // (2 * merge_size) == high // (2 * merge_size)
+                        and high < size
+                    ):
+                        comparators.append((low, high))
+            distance //= 2
+        merge_size *= 2
+    return comparators
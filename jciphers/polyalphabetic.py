@@ -0,0 +1,164 @@
+"""Polyalphabetic substitution ciphers built on a shared key schedule.
+
+A KeySchedule turns a key into a shift vector once; every cipher then maps each
+letter with a single lookup into a 26×26 table, indexed by the row of the key
+letter and the column of the message letter.
+"""
+import string
+from itertools import cycle
+
+from jciphers.helper import (
+    UnsupportedKeyError,
+    UnsupportedMessageError,
+    format_cipher_string,
+)
+
+__all__ = [
+    "KeySchedule",
+    "decrypt_autokey",
+    "decrypt_beaufort",
+    "decrypt_running_key",
+    "decrypt_standard_vigenere",
+    "decrypt_variant_beaufort",
+    "encrypt_autokey",
+    "encrypt_beaufort",
+    "encrypt_running_key",
+    "encrypt_standard_vigenere",
+    "encrypt_variant_beaufort",
+]
+
+_LETTERS = string.ascii_uppercase.encode()
+_NON_LETTERS = bytes(
+    byte for byte in range(256) if chr(byte) not in string.ascii_letters
+)
+_UPPERCASE_TABLE = bytes.maketrans(string.ascii_lowercase.encode(), _LETTERS)
+# Row r, column c holds the letter (c + r) % 26.
+_TABULA_RECTA = bytes(
+    _LETTERS[(col + row) % 26] for row in range(26) for col in range(26)
+)
+# Row r, column c holds the letter (r - c) % 26.
+_BEAUFORT_TABLE = bytes(
+    _LETTERS[(row - col) % 26] for row in range(26) for col in range(26)
+)
+# Rows are stored as table offsets with the ordinal of "A" already subtracted, so
+# a message byte indexes its column directly.
+_ROWS = [shift * 26 - 65 for shift in range(26)]
+_INVERSE_ROWS = [(26 - shift) % 26 * 26 - 65 for shift in range(26)]
+
+
+class KeySchedule:
+    """Shift vector of a repeating key, built once and reused for every message.
+
+    The offset is added to every shift; the original Vigenère functions of this
+    package use an offset of 1, so that the key letter A shifts by one.
+    """
+
+    def __init__(self, key: str, offset: int = 0):
+        key = format_cipher_string(key)
+        if not key:
+            raise UnsupportedKeyError("A key requires at least one letter.")
+        for char in key:
+            if char not in string.ascii_uppercase:
+                raise UnsupportedKeyError(
+                    f"Unsupported character in key: {char}. Only Latin characters are supported at this time."
+                )
+        self.shifts = bytes((ord(char) - 65 + offset) % 26 for char in key)
+        self.rows = [_ROWS[shift] for shift in self.shifts]
+        self.inverse_rows = [_INVERSE_ROWS[shift] for shift in self.shifts]
+
+    def __len__(self) -> int:
+        return len(self.shifts)
+
+
+def decrypt_autokey(encrypted_message: str, primer: str) -> str:
+    """Decrypts an autokey Vigenère, feeding each recovered letter back into the key."""
+    encrypted_message = _format_message(encrypted_message)
+    rows = _schedule(primer).inverse_rows.copy()
+    decrypted_message = bytearray()
+    for index, char in enumerate(encrypted_message):
+        plain_char = _TABULA_RECTA[rows[index] + char]
+        decrypted_message.append(plain_char)
+        rows.append(_INVERSE_ROWS[plain_char - 65])
+    return decrypted_message.decode()
+
+
+def decrypt_beaufort(encrypted_message: str, key: str | KeySchedule) -> str:
+    """Decrypts a Beaufort cipher, which is its own inverse."""
+    return encrypt_beaufort(encrypted_message, key)
+
+
+def decrypt_running_key(encrypted_message: str, key_path: str) -> str:
+    """Decrypts a running key cipher, streaming the key letters from a text file."""
+    return _apply_running_key(encrypted_message, key_path, _INVERSE_ROWS)
+
+
+def decrypt_standard_vigenere(encrypted_message: str, key: str | KeySchedule) -> str:
+    return _apply(
+        _format_message(encrypted_message),
+        _TABULA_RECTA,
+        cycle(_schedule(key).inverse_rows),
+    )
+
+
+def decrypt_variant_beaufort(encrypted_message: str, key: str | KeySchedule) -> str:
+    return encrypt_standard_vigenere(encrypted_message, key)
+
+
+def encrypt_autokey(message: str, primer: str) -> str:
+    """Encrypts with the primer followed by the message itself as the key."""
+    message = _format_message(message)
+    rows = _schedule(primer).rows + [_ROWS[char - 65] for char in message]
+    return _apply(message, _TABULA_RECTA, rows)
+
+
+def encrypt_beaufort(message: str, key: str | KeySchedule) -> str:
+    return _apply(_format_message(message), _BEAUFORT_TABLE, cycle(_schedule(key).rows))
+
+
+def encrypt_running_key(message: str, key_path: str) -> str:
+    """Encrypts a running key cipher, streaming the key letters from a text file."""
+    return _apply_running_key(message, key_path, _ROWS)
+
+
+def encrypt_standard_vigenere(message: str, key: str | KeySchedule) -> str:
+    return _apply(_format_message(message), _TABULA_RECTA, cycle(_schedule(key).rows))
+
+
+def encrypt_variant_beaufort(message: str, key: str | KeySchedule) -> str:
+    return decrypt_standard_vigenere(message, key)
+
+
+def _apply(message: bytes, table: bytes, rows) -> str:
+    return bytes(table[row + char] for char, row in zip(message, rows)).decode()
+
+
+def _apply_running_key(message: str, key_path: str, rows_by_shift: list[int]) -> str:
+    message = _format_message(message)
+    rows = (rows_by_shift[char - 65] for char in _iter_key_letters(key_path))
+    transformed_message = _apply(message, _TABULA_RECTA, rows)
+    if len(transformed_message) < len(message):
+        raise UnsupportedKeyError("The running key is shorter than the message.")
+    return transformed_message
+
+
+def _format_message(message: str) -> bytes:
+    formatted_message = format_cipher_string(message)
+    message = formatted_message.encode()
+    if message.translate(None, _LETTERS):
+        for char in formatted_message:
+            if char not in string.ascii_uppercase:
+                raise UnsupportedMessageError(
+                    f"Unsupported character in message: {char}. Only Latin characters are supported at this time."
+                )
+    return message
+
+
+def _iter_key_letters(key_path: str, chunk_size: int = 1 << 16):
+    """Yields the uppercase letters of a text file, skipping everything else."""
+    with open(key_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            yield from chunk.translate(_UPPERCASE_TABLE, _NON_LETTERS)
+
+
+def _schedule(key: str | KeySchedule) -> KeySchedule:
+    return key if isinstance(key, KeySchedule) else KeySchedule(key)
@@ -1,18 +1,45 @@
 """Substitution ciphers."""
-import random
+import secrets
 import string
 
-from jciphers.helper import format_cipher_string
+from jciphers.helper import (
+    UnsupportedMessageError,
+    buffer_address,
+    buffers_overlap,
+    format_cipher_string,
+)
+from jciphers.polyalphabetic import (
+    KeySchedule,
+    decrypt_standard_vigenere,
+    encrypt_standard_vigenere,
+)
 
 __all__ = [
     "decrypt_caesar_shift",
+    "decrypt_caesar_shift_into",
     "decrypt_general_substitution_with_key",
+    "decrypt_general_substitution_with_key_into",
     "decrypt_mlecchita_vikaalpa_roman",
+    "decrypt_mlecchita_vikaalpa_roman_into",
     "decrypt_vigenere",
+    "decrypt_vigenere_into",
     "encrypt_caesar_shift",
+    "encrypt_caesar_shift_into",
     "encrypt_general_substitution_with_key",
+    "encrypt_general_substitution_with_key_into",
     "encrypt_mlecchita_vikaalpa_roman",
+    "encrypt_mlecchita_vikaalpa_roman_into",
     "encrypt_vigenere",
+    "encrypt_vigenere_into",
+]
+
+# Buffer variants translate at most this many bytes at a time, so their scratch
+# memory stays flat regardless of the message size.
+_CHUNK_SIZE = 1 << 16
+_LETTERS = string.ascii_uppercase.encode()
+_SHIFT_TABLES = [
+    bytes.maketrans(_LETTERS, _LETTERS[shifts:] + _LETTERS[:shifts])
+    for shifts in range(26)
 ]
 
 _mlecchita_vikaalpa_roman_cipher = {
@@ -60,6 +87,14 @@ def decrypt_caesar_shift(encrypted_message: str, shifts: int) -> str:
     return decrypted_message
 
 
+def decrypt_caesar_shift_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, shifts: int
+) -> int:
+    """Decrypts an uppercase Caesar shift from src into dst, which may be the same buffer."""
+    _validate_shifts(shifts)
+    return _translate_into(src, dst, [_SHIFT_TABLES[26 - shifts]])
+
+
 def decrypt_general_substitution_with_key(message: str, key: str) -> str:
     message = format_cipher_string(message)
     key = format_cipher_string(key)
@@ -70,6 +105,14 @@ def decrypt_general_substitution_with_key(message: str, key: str) -> str:
     return encrypted_message
 
 
+def decrypt_general_substitution_with_key_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, key: str
+) -> int:
+    cipher_key = _build_caesar_cipher_key(format_cipher_string(key))
+    table = bytes.maketrans(cipher_key.encode(), _LETTERS)
+    return _translate_into(src, dst, [table])
+
+
 def decrypt_mlecchita_vikaalpa_roman(
     encrypted_message: str, cipher_alphabet: str
 ) -> str:
@@ -81,6 +124,15 @@ def decrypt_mlecchita_vikaalpa_roman(
     return decrypted_message
 
 
+def decrypt_mlecchita_vikaalpa_roman_into(
+    src: bytes | bytearray | memoryview,
+    dst: bytearray | memoryview,
+    cipher_alphabet: str,
+) -> int:
+    table = bytes.maketrans(cipher_alphabet.encode(), _LETTERS)
+    return _translate_into(src, dst, [table])
+
+
 def decrypt_mlecchita_vikaalpa_roman_default_cipher(encrypted_message: str) -> str:
     encrypted_message = format_cipher_string(encrypted_message)
     decrypted_message = ""
@@ -90,20 +142,15 @@ def decrypt_mlecchita_vikaalpa_roman_default_cipher(encrypted_message: str) -> s
 
 
 def decrypt_vigenere(message: str, key: str) -> str:
-    message = format_cipher_string(message)
-    key = format_cipher_string(key)
-    key_index = 0
-    encrypted_message = ""
-    for char in message:
-        ordinal = ord(char)
-        key_ordinal = ord(key[key_index]) + 1 - 65
-        if ordinal - key_ordinal < 65:
-            ordinal += 26
-        encrypted_message += chr(ordinal - key_ordinal)
-        key_index += 1
-        if key_index == len(key):
-            key_index = 0
-    return encrypted_message
+    return decrypt_standard_vigenere(message, KeySchedule(key, offset=1))
+
+
+def decrypt_vigenere_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, key: str
+) -> int:
+    shifts = KeySchedule(key, offset=1).shifts
+    tables = [_SHIFT_TABLES[(26 - shift) % 26] for shift in shifts]
+    return _translate_into(src, dst, tables)
 
 
 def encrypt_caesar_shift(message: str, shifts: int) -> str:
@@ -121,6 +168,14 @@ def encrypt_caesar_shift(message: str, shifts: int) -> str:
     return encrypted_message
 
 
+def encrypt_caesar_shift_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, shifts: int
+) -> int:
+    """Encrypts an uppercase message from src into dst, which may be the same buffer."""
+    _validate_shifts(shifts)
+    return _translate_into(src, dst, [_SHIFT_TABLES[shifts]])
+
+
 def encrypt_general_substitution_with_key(message: str, key: str) -> str:
     message = format_cipher_string(message)
     key = format_cipher_string(key)
@@ -131,16 +186,34 @@ def encrypt_general_substitution_with_key(message: str, key: str) -> str:
     return encrypted_message
 
 
+def encrypt_general_substitution_with_key_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, key: str
+) -> int:
+    cipher_key = _build_caesar_cipher_key(format_cipher_string(key))
+    table = bytes.maketrans(_LETTERS, cipher_key.encode())
+    return _translate_into(src, dst, [table])
+
+
 def encrypt_mlecchita_vikaalpa_roman(message: str) -> tuple[str, str]:
     message = format_cipher_string(message)
     cipher_alphabet = list(string.ascii_uppercase)
-    random.shuffle(cipher_alphabet)
+    secrets.SystemRandom().shuffle(cipher_alphabet)
     encrypted_message = ""
     for char in message:
         encrypted_message += cipher_alphabet[ord(char) - 65]
     return encrypted_message, "".join(cipher_alphabet)
 
 
+def encrypt_mlecchita_vikaalpa_roman_into(
+    src: bytes | bytearray | memoryview,
+    dst: bytearray | memoryview,
+    cipher_alphabet: str,
+) -> int:
+    """Encrypts with a caller-provided cipher alphabet, which can be reused across records."""
+    table = bytes.maketrans(_LETTERS, cipher_alphabet.encode())
+    return _translate_into(src, dst, [table])
+
+
 def encrypt_mlecchita_vikaalpa_roman_default_cipher(message: str) -> str:
     message = format_cipher_string(message)
     encrypted_message = ""
@@ -150,39 +223,69 @@ def encrypt_mlecchita_vikaalpa_roman_default_cipher(message: str) -> str:
 
 
 def encrypt_vigenere(message: str, key: str) -> str:
-    message = format_cipher_string(message)
-    key = format_cipher_string(key)
-    key_index = 0
-    encrypted_message = ""
-    for char in message:
-        ordinal = ord(char)
-        key_ordinal = ord(key[key_index]) + 1 - 65
-        if ordinal + key_ordinal > 90:
-            ordinal -= 26
-        encrypted_message += chr(ordinal + key_ordinal)
-        key_index += 1
-        if key_index == len(key):
-            key_index = 0
-    return encrypted_message
+    return encrypt_standard_vigenere(message, KeySchedule(key, offset=1))
+
+
+def encrypt_vigenere_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, key: str
+) -> int:
+    shifts = KeySchedule(key, offset=1).shifts
+    tables = [_SHIFT_TABLES[shift] for shift in shifts]
+    return _translate_into(src, dst, tables)
 
 
 def _build_caesar_cipher_key(key: str) -> str:
     """Builds a Caesar cipher using a key."""
-    cipher_key = [0] * 26
-    cipher_key_len = 0
-    last_ord = None
+    cipher_key = ""
     for char in key:
         if char not in cipher_key:
-            cipher_key[cipher_key_len] = char
-            last_ord = ord(char)
-            cipher_key_len += 1
-    last_ord += 1
-    # TODO: Protect against clowns using the whole alphabet
-    for i in range(26 - cipher_key_len):
-        cipher_key[cipher_key_len + i] = chr(last_ord)
-        last_ord += 1
-        if last_ord > 90:
-            last_ord -= 26
-        while chr(last_ord) in cipher_key:
-            last_ord += 1
+            cipher_key += char
+    if not cipher_key:
+        return string.ascii_uppercase
+    last_ord = ord(cipher_key[-1])
+    while len(cipher_key) < 26:
+        last_ord = last_ord + 1 if last_ord < 90 else 65
+        if chr(last_ord) not in cipher_key:
+            cipher_key += chr(last_ord)
     return cipher_key
+
+
+def _translate_into(
+    src: bytes | bytearray | memoryview,
+    dst: bytearray | memoryview,
+    tables: list[bytes],
+) -> int:
+    """Translates src into dst, cycling through one table per key position.
+
+    src and dst may be the same memory, but must not overlap at different offsets.
+    """
+    length = len(src)
+    if len(dst) < length:
+        raise ValueError("The destination buffer is smaller than the source buffer.")
+    key_length = len(tables)
+    chunk_size = max(_CHUNK_SIZE // key_length, 1) * key_length
+    with memoryview(src) as source, memoryview(dst) as destination:
+        # Chunks are copied before they are written back, so in-place
+        # translation is safe as long as both buffers start at the same byte.
+        if buffers_overlap(source, destination):
+            if buffer_address(source) != buffer_address(destination):
+                raise ValueError("The source and destination buffers partly overlap.")
+        for start in range(0, length, chunk_size):
+            chunk = source[start : start + chunk_size].tobytes()
+            if unsupported_bytes := chunk.translate(None, _LETTERS):
+                raise UnsupportedMessageError(
+                    f"Unsupported byte in message: {unsupported_bytes[:1]!r}. Buffers may only hold uppercase Latin letters."
+                )
+            end = start + len(chunk)
+            for key_index, table in enumerate(tables):
+                destination[start + key_index : end : key_length] = chunk[
+                    key_index::key_length
+                ].translate(table)
+    return length
+
+
+def _validate_shifts(shifts: int) -> None:
+    if shifts < 1 or shifts > 25:
+        raise IndexError(
+            "A Caesar shift cipher requires at least 1 shift or at most 25 shifts."
+        )
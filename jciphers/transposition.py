@@ -1,6 +1,12 @@
 """Transposition ciphers."""
+from jciphers.helper import buffers_overlap
 
-__all__ = ["decrypt_rail_fence", "encrypt_rail_fence"]
+__all__ = [
+    "decrypt_rail_fence",
+    "decrypt_rail_fence_into",
+    "encrypt_rail_fence",
+    "encrypt_rail_fence_into",
+]
 
 
 def decrypt_rail_fence(encrypted_message: str, levels: int) -> str:
@@ -18,6 +24,21 @@ def decrypt_rail_fence(encrypted_message: str, levels: int) -> str:
     return "".join(array)
 
 
+def decrypt_rail_fence_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, levels: int
+) -> int:
+    """Decrypts a formatted rail fence message from src into a separate dst buffer."""
+    length = len(src)
+    with memoryview(src) as source, memoryview(dst) as destination:
+        _validate_rail_fence_buffers(source, destination, levels)
+        offset = 0
+        for rail in range(levels):
+            rail_length = len(range(rail, length, levels))
+            destination[rail:length:levels] = source[offset : offset + rail_length]
+            offset += rail_length
+    return length
+
+
 def encrypt_rail_fence(message: str, levels: int) -> str:
     """Transposes letters of a message in an alternating fashion using n alternate lines."""
     message = message.replace(" ", "")
@@ -32,3 +53,31 @@ def encrypt_rail_fence(message: str, levels: int) -> str:
     for array in arrays:
         joined_arrays += array
     return "".join(joined_arrays)
+
+
+def encrypt_rail_fence_into(
+    src: bytes | bytearray | memoryview, dst: bytearray | memoryview, levels: int
+) -> int:
+    """Transposes a formatted message from src into a separate dst buffer."""
+    length = len(src)
+    with memoryview(src) as source, memoryview(dst) as destination:
+        _validate_rail_fence_buffers(source, destination, levels)
+        offset = 0
+        for rail in range(levels):
+            rail_length = len(range(rail, length, levels))
+            destination[offset : offset + rail_length] = source[rail:length:levels]
+            offset += rail_length
+    return length
+
+
+def _validate_rail_fence_buffers(
+    source: memoryview, destination: memoryview, levels: int
+) -> None:
+    if levels < 1:
+        raise ValueError("A rail fence needs at least one level.")
+    if len(destination) < len(source):
+        raise ValueError("The destination buffer is smaller than the source buffer.")
+    if buffers_overlap(source, destination):
+        raise ValueError(
+            "A rail fence cannot be transposed into an overlapping buffer."
+        )
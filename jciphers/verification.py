@@ -0,0 +1,486 @@
+"""Differential correctness and throughput checks across cipher backends.
+
+Every backend of a cipher is run on the same seeded random messages and keys and
+must produce output identical to the reference string implementation. Run with
+``python -m jciphers.verification`` to print throughput per backend.
+"""
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+from jciphers.incremental import (
+    encrypt_caesar_shift_incremental,
+    encrypt_rail_fence_incremental,
+    encrypt_vigenere_incremental,
+)
+from jciphers.helper import format_cipher_string
+from jciphers.polyalphabetic import (
+    KeySchedule,
+    decrypt_autokey,
+    decrypt_beaufort,
+    decrypt_running_key,
+    decrypt_variant_beaufort,
+    encrypt_autokey,
+    encrypt_beaufort,
+    encrypt_running_key,
+    encrypt_variant_beaufort,
+)
+from jciphers.substitution import (
+    decrypt_caesar_shift,
+    decrypt_caesar_shift_into,
+    decrypt_general_substitution_with_key,
+    decrypt_general_substitution_with_key_into,
+    decrypt_mlecchita_vikaalpa_roman,
+    decrypt_mlecchita_vikaalpa_roman_into,
+    decrypt_vigenere,
+    decrypt_vigenere_into,
+    encrypt_caesar_shift,
+    encrypt_caesar_shift_into,
+    encrypt_general_substitution_with_key,
+    encrypt_general_substitution_with_key_into,
+    encrypt_mlecchita_vikaalpa_roman,
+    encrypt_mlecchita_vikaalpa_roman_into,
+    encrypt_vigenere,
+    encrypt_vigenere_into,
+)
+from jciphers.transposition import (
+    decrypt_rail_fence,
+    decrypt_rail_fence_into,
+    encrypt_rail_fence,
+    encrypt_rail_fence_into,
+)
+
+__all__ = [
+    "BackendMismatchError",
+    "BackendResult",
+    "run_differential",
+]
+
+_PARALLEL_CHUNK_SIZE = 1 << 12
+
+
+class BackendMismatchError(Exception):
+    """A backend produced output different from the reference implementation."""
+
+
+@dataclass
+class BackendResult:
+    cipher: str
+    backend: str
+    characters: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Characters processed per second."""
+        return self.characters / self.seconds if self.seconds else float("inf")
+
+
+@dataclass
+class _CipherSpec:
+    name: str
+    generate_key: object
+    reference_encrypt: object
+    reference_decrypt: object
+    encrypt_backends: dict = field(default_factory=dict)
+    decrypt_backends: dict = field(default_factory=dict)
+    # Encrypts with a key of its own choosing, returned with the ciphertext; only
+    # its round trip through the reference decrypt can be checked.
+    unseeded_encrypt: object = None
+
+
+def run_differential(
+    seed: int = 0, samples: int = 100, max_length: int = 2000
+) -> list[BackendResult]:
+    """Checks every backend against the reference and returns throughput results.
+
+    Raises a BackendMismatchError on the first message where a backend differs
+    from the reference or a round trip does not return the original message.
+    """
+    rng = random.Random(seed)
+    results = {}
+    # One pool for the whole run, so the parallel backend is not timed starting it.
+    with ThreadPoolExecutor() as executor:
+        for spec in _cipher_specs(max_length, executor):
+            for _ in range(samples):
+                _check_sample(spec, rng, max_length, results)
+    return list(results.values())
+
+
+def _buffer_backend(function):
+    def backend(message, key, _):
+        buffer = bytearray(len(message))
+        function(message.encode(), buffer, key)
+        return buffer.decode()
+
+    return backend
+
+
+def _check_sample(spec, rng, max_length, results) -> None:
+    """Runs the reference and every backend of a cipher on one random message."""
+    message = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(0, max_length)))
+    key = spec.generate_key(rng)
+    start = time.perf_counter()
+    encrypted_message, key = spec.reference_encrypt(message, key)
+    _record(results, spec.name, "reference encrypt", message, start)
+    start = time.perf_counter()
+    decrypted_message = spec.reference_decrypt(encrypted_message, key)
+    _record(results, spec.name, "reference decrypt", message, start)
+    if decrypted_message != message:
+        raise BackendMismatchError(
+            f"{spec.name} reference round trip failed for key {key!r}."
+        )
+    if spec.unseeded_encrypt is not None:
+        start = time.perf_counter()
+        unseeded_message, unseeded_key = spec.unseeded_encrypt(message)
+        _record(results, spec.name, "unseeded encrypt", message, start)
+        if spec.reference_decrypt(unseeded_message, unseeded_key) != message:
+            raise BackendMismatchError(
+                f"{spec.name} unseeded round trip failed for key {unseeded_key!r}."
+            )
+    for direction, backends, source, expected in (
+        ("encrypt", spec.encrypt_backends, message, encrypted_message),
+        ("decrypt", spec.decrypt_backends, encrypted_message, message),
+    ):
+        for backend, function in backends.items():
+            start = time.perf_counter()
+            output = function(source, key, rng)
+            _record(results, spec.name, f"{backend} {direction}", source, start)
+            if output != expected:
+                raise BackendMismatchError(
+                    f"{spec.name} {backend} {direction} differs from the "
+                    f"reference for key {key!r}."
+                )
+
+
+def _chunked_parallel_backend(function, executor):
+    """Runs a buffer variant over key-aligned chunks on a thread pool."""
+
+    def backend(message, key, _):
+        source = message.encode()
+        buffer = bytearray(len(source))
+        key_length = len(key) if isinstance(key, str) else 1
+        chunk_size = max(_PARALLEL_CHUNK_SIZE // key_length, 1) * key_length
+        with memoryview(buffer) as destination:
+            futures = [
+                executor.submit(
+                    function,
+                    source[start : start + chunk_size],
+                    destination[start : start + chunk_size],
+                    key,
+                )
+                for start in range(0, len(source), chunk_size)
+            ]
+            for future in futures:
+                future.result()
+        return buffer.decode()
+
+    return backend
+
+
+def _in_place_backend(function):
+    def backend(message, key, _):
+        buffer = bytearray(message.encode())
+        function(buffer, buffer, key)
+        return buffer.decode()
+
+    return backend
+
+
+def _incremental_backend(function):
+    """Feeds the message as a growing document, appending a random piece per call."""
+
+    def backend(message, key, rng):
+        state = None
+        encrypted_message = ""
+        end = 0
+        while end < len(message):
+            end += rng.randint(1, 512)
+            encrypted_message, state = function(message[:end], key, state)
+        return encrypted_message
+
+    return backend
+
+
+def _key_schedule_backend(function):
+    def backend(message, key, _=None):
+        return function(message, KeySchedule(key))
+
+    return backend
+
+
+def _random_key(rng: random.Random, max_length: int = 12) -> str:
+    return "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, max_length)))
+
+
+def _record(results, cipher, backend, source, start) -> None:
+    elapsed = time.perf_counter() - start
+    result = results.setdefault((cipher, backend), BackendResult(cipher, backend))
+    result.characters += len(source)
+    result.seconds += elapsed
+
+
+def _reference(function):
+    return lambda message, key: (function(message, key), key)
+
+
+def _reference_autokey(encrypted_message: str, primer: str) -> str:
+    decrypted_message = ""
+    key = primer
+    for index, char in enumerate(encrypted_message):
+        plain_char = chr((ord(char) - ord(key[index])) % 26 + 65)
+        decrypted_message += plain_char
+        key += plain_char
+    return decrypted_message
+
+
+# The character loops that encrypt_vigenere and decrypt_vigenere replaced, kept
+# as the reference for the table-driven implementations.
+def _reference_decrypt_vigenere(message: str, key: str) -> str:
+    message = format_cipher_string(message)
+    key = format_cipher_string(key)
+    key_index = 0
+    encrypted_message = ""
+    for char in message:
+        ordinal = ord(char)
+        key_ordinal = ord(key[key_index]) + 1 - 65
+        if ordinal - key_ordinal < 65:
+            ordinal += 26
+        encrypted_message += chr(ordinal - key_ordinal)
+        key_index += 1
+        if key_index == len(key):
+            key_index = 0
+    return encrypted_message
+
+
+def _reference_encrypt_vigenere(message: str, key: str) -> str:
+    message = format_cipher_string(message)
+    key = format_cipher_string(key)
+    key_index = 0
+    encrypted_message = ""
+    for char in message:
+        ordinal = ord(char)
+        key_ordinal = ord(key[key_index]) + 1 - 65
+        if ordinal + key_ordinal > 90:
+            ordinal -= 26
+        encrypted_message += chr(ordinal + key_ordinal)
+        key_index += 1
+        if key_index == len(key):
+            key_index = 0
+    return encrypted_message
+
+
+def _reference_mlecchita_vikaalpa_roman(message: str, cipher_alphabet: str) -> str:
+    return "".join(cipher_alphabet[ord(char) - 65] for char in message)
+
+
+def _reference_shift(sign: int, key_sign: int, key_letters=None):
+    """Adds the signed message and key letters one letter at a time.
+
+    The key repeats unless key_letters derives the key letters from it.
+    """
+
+    def reference(message: str, key: str) -> str:
+        letters = key_letters(message, key) if key_letters else key * len(message)
+        shifted_message = ""
+        for char, key_char in zip(message, letters):
+            shift = sign * (ord(char) - 65) + key_sign * (ord(key_char) - 65)
+            shifted_message += chr(shift % 26 + 65)
+        return shifted_message
+
+    return reference
+
+
+def _running_key_backend(function):
+    """Writes the running key text to a file, since the ciphers stream it from one."""
+
+    def backend(message, key, _=None):
+        with tempfile.TemporaryDirectory() as directory:
+            key_path = os.path.join(directory, "key.txt")
+            with open(key_path, "w") as file:
+                file.write(key)
+            return function(message, key_path)
+
+    return backend
+
+
+def _running_key_letters(_, key: str) -> str:
+    return "".join(char for char in key.upper() if char in string.ascii_uppercase)
+
+
+def _string_backend(function):
+    return lambda message, key, _=None: function(message, key)
+
+
+def _cipher_specs(max_length: int, executor: Executor) -> list[_CipherSpec]:
+    substitution_specs = [
+        (
+            "Caesar shift",
+            lambda rng: rng.randint(1, 25),
+            _reference(encrypt_caesar_shift),
+            decrypt_caesar_shift,
+            encrypt_caesar_shift_into,
+            decrypt_caesar_shift_into,
+            encrypt_caesar_shift_incremental,
+        ),
+        (
+            "General substitution",
+            partial(_random_key, max_length=40),
+            _reference(encrypt_general_substitution_with_key),
+            decrypt_general_substitution_with_key,
+            encrypt_general_substitution_with_key_into,
+            decrypt_general_substitution_with_key_into,
+            None,
+        ),
+        (
+            "Mlecchita Vikaalpa (Roman)",
+            lambda rng: "".join(rng.sample(string.ascii_uppercase, 26)),
+            _reference(_reference_mlecchita_vikaalpa_roman),
+            decrypt_mlecchita_vikaalpa_roman,
+            encrypt_mlecchita_vikaalpa_roman_into,
+            decrypt_mlecchita_vikaalpa_roman_into,
+            None,
+        ),
+        (
+            "Vigenère",
+            _random_key,
+            _reference(_reference_encrypt_vigenere),
+            _reference_decrypt_vigenere,
+            encrypt_vigenere_into,
+            decrypt_vigenere_into,
+            encrypt_vigenere_incremental,
+        ),
+    ]
+    specs = []
+    for (
+        name,
+        generate_key,
+        reference_encrypt,
+        reference_decrypt,
+        encrypt_into,
+        decrypt_into,
+        encrypt_incremental,
+    ) in substitution_specs:
+        spec = _CipherSpec(name, generate_key, reference_encrypt, reference_decrypt)
+        spec.encrypt_backends = {
+            "buffer": _buffer_backend(encrypt_into),
+            "in-place": _in_place_backend(encrypt_into),
+            "chunked parallel": _chunked_parallel_backend(encrypt_into, executor),
+        }
+        spec.decrypt_backends = {
+            "buffer": _buffer_backend(decrypt_into),
+            "in-place": _in_place_backend(decrypt_into),
+            "chunked parallel": _chunked_parallel_backend(decrypt_into, executor),
+        }
+        if name == "Vigenère":
+            spec.encrypt_backends["string"] = _string_backend(encrypt_vigenere)
+            spec.decrypt_backends["string"] = _string_backend(decrypt_vigenere)
+        if name == "Mlecchita Vikaalpa (Roman)":
+            # The string function draws its alphabet from the secrets module.
+            spec.unseeded_encrypt = encrypt_mlecchita_vikaalpa_roman
+        if encrypt_incremental is not None:
+            spec.encrypt_backends["incremental"] = _incremental_backend(
+                partial(encrypt_incremental, block_size=64)
+            )
+        specs.append(spec)
+    specs.append(
+        _CipherSpec(
+            "Rail fence",
+            lambda rng: rng.randint(2, 99),
+            _reference(encrypt_rail_fence),
+            decrypt_rail_fence,
+            encrypt_backends={
+                "buffer": _buffer_backend(encrypt_rail_fence_into),
+                "incremental": _incremental_backend(encrypt_rail_fence_incremental),
+            },
+            decrypt_backends={"buffer": _buffer_backend(decrypt_rail_fence_into)},
+        )
+    )
+    polyalphabetic_specs = [
+        (
+            "Beaufort",
+            _random_key,
+            _reference_shift(-1, 1),
+            _reference_shift(-1, 1),
+            encrypt_beaufort,
+            decrypt_beaufort,
+        ),
+        (
+            "Variant Beaufort",
+            _random_key,
+            _reference_shift(1, -1),
+            _reference_shift(1, 1),
+            encrypt_variant_beaufort,
+            decrypt_variant_beaufort,
+        ),
+    ]
+    for (
+        name,
+        generate_key,
+        reference_encrypt,
+        reference_decrypt,
+        encrypt,
+        decrypt,
+    ) in polyalphabetic_specs:
+        specs.append(
+            _CipherSpec(
+                name,
+                generate_key,
+                _reference(reference_encrypt),
+                reference_decrypt,
+                encrypt_backends={
+                    "string": _string_backend(encrypt),
+                    "key schedule": _key_schedule_backend(encrypt),
+                },
+                decrypt_backends={
+                    "string": _string_backend(decrypt),
+                    "key schedule": _key_schedule_backend(decrypt),
+                },
+            )
+        )
+    specs.append(
+        _CipherSpec(
+            "Autokey",
+            _random_key,
+            _reference(_reference_shift(1, 1, lambda message, key: key + message)),
+            _reference_autokey,
+            encrypt_backends={"string": _string_backend(encrypt_autokey)},
+            decrypt_backends={"string": _string_backend(decrypt_autokey)},
+        )
+    )
+    # Running key text holds spaces and punctuation, which the ciphers skip.
+    specs.append(
+        _CipherSpec(
+            "Running key",
+            lambda rng: "".join(
+                rng.choices(string.ascii_letters + " ,.", k=2 * max_length)
+            ),
+            _reference(_reference_shift(1, 1, _running_key_letters)),
+            _reference_shift(1, -1, _running_key_letters),
+            encrypt_backends={"file": _running_key_backend(encrypt_running_key)},
+            decrypt_backends={"file": _running_key_backend(decrypt_running_key)},
+        )
+    )
+    return specs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--max-length", type=int, default=2000)
+    arguments = parser.parse_args()
+    results = run_differential(arguments.seed, arguments.samples, arguments.max_length)
+    print("CIPHER | BACKEND | CHARACTERS PER SECOND")
+    for result in results:
+        print(f"{result.cipher} | {result.backend} | {result.throughput:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
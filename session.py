@@ -0,0 +1,310 @@
+"""Concurrent interactive sessions of jciphers over a local socket.
+
+Every connection gets its own session with its own cipher message history. The
+menus are the same as in the terminal, but prompts are coroutines and ciphers
+run on an executor, so a large message for one user does not stall the others.
+"""
+import argparse
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from jcipherclasses import (
+    CaesarShiftCipher,
+    MlecchitaVikaalpaRomanCipher,
+    RailFenceCipher,
+    VigenereCipher,
+)
+from jciphers.helper import (
+    UnsupportedKeyError,
+    UnsupportedMessageError,
+    format_cipher_string,
+)
+from jciphers.substitution import (
+    decrypt_caesar_shift,
+    decrypt_mlecchita_vikaalpa_roman,
+    decrypt_vigenere,
+    encrypt_caesar_shift,
+    encrypt_mlecchita_vikaalpa_roman,
+    encrypt_vigenere,
+)
+from jciphers.transposition import decrypt_rail_fence, encrypt_rail_fence
+from util import banner, validate_key, validate_message
+
+__all__ = [
+    "DEFAULT_LINE_LIMIT",
+    "CipherSession",
+    "SessionClosedError",
+    "serve",
+    "start_server",
+]
+
+# asyncio limits stream lines to 64 KiB by default, which would cut large
+# messages short. Lines longer than the limit are discarded with an error.
+DEFAULT_LINE_LIMIT = 1 << 26
+
+_SUBSTITUTION_CIPHERS = {
+    "Caesar Shift": CaesarShiftCipher,
+    "Mlecchita Vikaalpa (Roman)": MlecchitaVikaalpaRomanCipher,
+    "Vigenère": VigenereCipher,
+}
+_TRANSPOSITION_CIPHERS = {"Rail Fence": RailFenceCipher}
+
+
+class SessionClosedError(Exception):
+    """The user disconnected while a prompt was waiting for input."""
+
+
+class CipherSession:
+    """Menus and message history of one user, driven over a stream pair."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        executor: Executor | None = None,
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.executor = executor
+        self.ciphers = {}
+
+    async def cipher_loop(self, cipher) -> None:
+        continue_index = None
+        while continue_index is None or continue_index == 0:
+            await self.write(banner(cipher.title))
+            try:
+                choice_index = await self.option_selection(
+                    "Choose a function:", cipher.function_options
+                )
+                if choice_index == 0:
+                    await self.run_cipher(cipher, decrypt=False)
+                elif choice_index == 1:
+                    await self.run_cipher(cipher, decrypt=True)
+                elif choice_index == 2:
+                    await self.write(cipher.format_last_fifteen_messages() + "\n")
+                elif choice_index == 3:
+                    return
+                continue_index = await self.option_selection(
+                    f"\nContinue using {cipher.title}s?", ["Yes", "No"]
+                )
+            except (UnsupportedKeyError, UnsupportedMessageError, ValueError) as error:
+                await self.write(f"{error}\n")
+
+    async def display_ciphers(self, title: str, ciphers: dict) -> None:
+        continue_index = None
+        while continue_index is None or continue_index == 0:
+            await self.write(banner(title))
+            names = list(ciphers)
+            choice_index = await self.option_selection(
+                f"Choose a {title.lower()[:-1]}:", names + ["Quit"]
+            )
+            if choice_index == len(names):
+                return
+            cipher_class = ciphers[names[choice_index]]
+            cipher = self.ciphers.setdefault(cipher_class, cipher_class())
+            await self.cipher_loop(cipher)
+            continue_index = await self.option_selection(
+                f"\nContinue using {title.lower()}?", ["Yes", "No"]
+            )
+
+    async def option_selection(self, prompt: str, options: list) -> int:
+        selection = prompt + "\n"
+        for index, choice in enumerate(options):
+            selection += f"({index + 1}) {choice}\n"
+        selection += "\n> "
+        choice_index = None
+        while choice_index is None or choice_index < 1 or choice_index > len(options):
+            try:
+                choice_index = int(await self.prompt(selection))
+            except ValueError:
+                await self.write("\nInvalid input. Must be a number.\n")
+                choice_index = None
+        return choice_index - 1
+
+    async def prompt(self, text: str) -> str:
+        await self.write(text)
+        try:
+            line = await self.reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            if not error.partial:
+                raise SessionClosedError() from error
+            line = error.partial
+        except asyncio.LimitOverrunError:
+            await self._discard_line()
+            raise ValueError("The input line is longer than the server allows.")
+        return line.decode(errors="replace").rstrip("\r\n")
+
+    async def prompt_number(self, text: str, minimum: int, maximum: int) -> int:
+        number = None
+        while number is None or number < minimum or number > maximum:
+            try:
+                number = int(await self.prompt(text))
+            except ValueError:
+                await self.write("\nInvalid input. Must be a number.\n")
+                number = None
+        return number
+
+    async def run(self) -> None:
+        """Runs the main menu until the user quits or disconnects."""
+        try:
+            choice_index = None
+            while choice_index != 2:
+                await self.write(banner("jciphers"))
+                choice_index = await self.option_selection(
+                    "\nChoose a cipher type.",
+                    ["Transposition", "Substitution", "Quit"],
+                )
+                if choice_index == 0:
+                    await self.display_ciphers(
+                        "Transposition Ciphers", _TRANSPOSITION_CIPHERS
+                    )
+                elif choice_index == 1:
+                    await self.display_ciphers(
+                        "Substitution Ciphers", _SUBSTITUTION_CIPHERS
+                    )
+        except (SessionClosedError, ConnectionError):
+            pass
+        finally:
+            self.writer.close()
+
+    async def run_cipher(self, cipher, decrypt: bool) -> None:
+        """Prompts for a message and key, then runs the cipher on the executor."""
+        function, prompt_parameter = _CIPHER_FUNCTIONS[type(cipher)][decrypt]
+        action = "decrypt" if decrypt else "encrypt"
+        message = await self.prompt(f"\nEnter a message to {action}: ")
+        arguments = []
+        if prompt_parameter is not None:
+            arguments.append(await prompt_parameter(self))
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self.executor, _run_cipher_function, function, message, *arguments
+        )
+        if isinstance(result, tuple):
+            result, parameter = result
+            await self.write(f"Generated cipher alphabet: {parameter}\n")
+        else:
+            parameter = arguments[0]
+        cipher.cache_message(result, parameter)
+        await self.write(f"Your {action}ed message is: {result}\n")
+
+    async def write(self, text: str) -> None:
+        self.writer.write(text.encode())
+        await self.writer.drain()
+
+    async def _discard_line(self) -> None:
+        """Skips the rest of an over-long line, so it is not read as the next input."""
+        while True:
+            try:
+                await self.reader.readuntil(b"\n")
+                return
+            except asyncio.IncompleteReadError as error:
+                raise SessionClosedError() from error
+            except asyncio.LimitOverrunError as error:
+                await self.reader.readexactly(error.consumed)
+
+
+async def _prompt_cipher_alphabet(session: CipherSession) -> str:
+    cipher_alphabet = await session.prompt("\nEnter the cipher alphabet: ")
+    validate_key(cipher_alphabet)
+    return cipher_alphabet
+
+
+async def _prompt_key(session: CipherSession) -> str:
+    key = await session.prompt("\nEnter a cipher key: ")
+    validate_key(key)
+    return format_cipher_string(key)
+
+
+async def _prompt_levels(session: CipherSession) -> int:
+    return await session.prompt_number(
+        "\nEnter number of transposition levels (min: 2, max: 99): ", 2, 99
+    )
+
+
+async def _prompt_shifts(session: CipherSession) -> int:
+    return await session.prompt_number(
+        "\nEnter number of cipher shifts (min: 1, max: 25): ", 1, 25
+    )
+
+
+def _run_cipher_function(function, message: str, *arguments):
+    """Validates and formats a message, then runs the cipher on it.
+
+    Validation loops over every character, so it runs on the executor with the
+    cipher instead of stalling the sessions on the event loop.
+    """
+    validate_message(message)
+    return function(format_cipher_string(message), *arguments)
+
+
+# Encrypt and decrypt function of every cipher class, each with the coroutine
+# prompting for its key. Mlecchita Vikaalpa generates its key when encrypting.
+_CIPHER_FUNCTIONS = {
+    CaesarShiftCipher: (
+        (encrypt_caesar_shift, _prompt_shifts),
+        (decrypt_caesar_shift, _prompt_shifts),
+    ),
+    MlecchitaVikaalpaRomanCipher: (
+        (encrypt_mlecchita_vikaalpa_roman, None),
+        (decrypt_mlecchita_vikaalpa_roman, _prompt_cipher_alphabet),
+    ),
+    RailFenceCipher: (
+        (encrypt_rail_fence, _prompt_levels),
+        (decrypt_rail_fence, _prompt_levels),
+    ),
+    VigenereCipher: (
+        (encrypt_vigenere, _prompt_key),
+        (decrypt_vigenere, _prompt_key),
+    ),
+}
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    executor: Executor | None = None,
+    limit: int = DEFAULT_LINE_LIMIT,
+) -> None:
+    """Serves a separate session to every connection until cancelled."""
+    server = await start_server(host, port, executor, limit)
+    async with server:
+        await server.serve_forever()
+
+
+async def start_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    executor: Executor | None = None,
+    limit: int = DEFAULT_LINE_LIMIT,
+) -> asyncio.Server:
+    """Starts accepting sessions; limit is the longest input line in bytes."""
+
+    async def handle_connection(reader, writer):
+        await CipherSession(reader, writer, executor).run()
+
+    return await asyncio.start_server(handle_connection, host, port, limit=limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_LINE_LIMIT,
+        help="longest input line in bytes",
+    )
+    arguments = parser.parse_args()
+    # Forked workers would inherit the sockets of connected users and keep them
+    # open after their sessions end, so workers are spawned instead.
+    with ProcessPoolExecutor(
+        max_workers=arguments.workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        asyncio.run(serve(arguments.host, arguments.port, executor, arguments.limit))
+
+
+if __name__ == "__main__":
+    main()
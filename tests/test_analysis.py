@@ -0,0 +1,78 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from jciphers.analysis import FrequencyCounter, analyse_file
+
+
+def _reference_counts(letters: str, size: int) -> dict:
+    return dict(
+        Counter(
+            letters[index : index + size] for index in range(len(letters) - size + 1)
+        )
+    )
+
+
+def _counts(counter: FrequencyCounter, size: int) -> dict:
+    return dict(counter.most_common(size, 26**size))
+
+
+@pytest.fixture
+def text():
+    rng = random.Random(0)
+    return "".join(rng.choices("AAB cd,ZzE", k=5000))
+
+
+def test_chunked_counts_match_whole_text(text):
+    letters = "".join(char for char in text.upper() if char.isalpha())
+    for chunk_size in (1, 2, 3, 7, 4096, len(text)):
+        counter = FrequencyCounter()
+        for start in range(0, len(text), chunk_size):
+            counter.update(text[start : start + chunk_size])
+        assert counter.length == len(letters)
+        for size in (1, 2, 3):
+            assert _counts(counter, size) == _reference_counts(letters, size)
+
+
+def test_merged_counts_match_whole_text(text):
+    whole = FrequencyCounter()
+    whole.update(text)
+    rng = random.Random(1)
+    merged = FrequencyCounter()
+    start = 0
+    while start < len(text):
+        end = start + rng.randint(0, 40)
+        part = FrequencyCounter()
+        part.update(text[start:end])
+        merged = merged.merge(part)
+        start = end
+    assert merged.length == whole.length
+    assert merged.unigram_counts == whole.unigram_counts
+    assert merged.bigram_counts == whole.bigram_counts
+    assert merged.trigram_counts == whole.trigram_counts
+
+
+def test_statistics():
+    counter = FrequencyCounter()
+    counter.update("AABB")
+    assert counter.index_of_coincidence() == pytest.approx(4 / 12)
+    assert counter.entropy() == pytest.approx(1.0)
+    assert math.isclose(FrequencyCounter().entropy(), 0.0)
+
+
+def test_most_common_rejects_unsupported_sizes():
+    with pytest.raises(ValueError):
+        FrequencyCounter().most_common(0)
+    with pytest.raises(ValueError):
+        FrequencyCounter().most_common(4)
+
+
+def test_analyse_file(tmp_path, text):
+    path = tmp_path / "message.txt"
+    path.write_text(text)
+    counter = analyse_file(str(path), chunk_size=10)
+    whole = FrequencyCounter()
+    whole.update(text)
+    assert counter.trigram_counts == whole.trigram_counts
@@ -0,0 +1,157 @@
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jciphers.container import (
+    CAESAR_SHIFT,
+    GENERAL_SUBSTITUTION,
+    MLECCHITA_VIKAALPA_ROMAN,
+    RAIL_FENCE,
+    VIGENERE,
+    ContainerFormatError,
+    ContainerIntegrityError,
+    ContainerReader,
+    write_container,
+)
+from jciphers.substitution import encrypt_vigenere
+
+MESSAGE = "the quick brown fox jumps over the lazy dog " * 20
+FORMATTED_MESSAGE = MESSAGE.replace(" ", "").upper()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "message.jcph")
+
+
+def _corrupt(path: str, offset: int) -> None:
+    with open(path, "r+b") as file:
+        file.seek(offset)
+        byte = file.read(1)
+        file.seek(offset)
+        file.write(bytes([byte[0] ^ 0xFF]))
+
+
+@pytest.mark.parametrize(
+    "cipher_id, params",
+    [
+        (CAESAR_SHIFT, {"shifts": 3}),
+        (GENERAL_SUBSTITUTION, {"key": "ZEBRA"}),
+        (MLECCHITA_VIKAALPA_ROMAN, {"cipher_alphabet": "QWERTYUIOPASDFGHJKLZXCVBNM"}),
+        (RAIL_FENCE, {"levels": 3}),
+        (VIGENERE, {"key": "LEMON"}),
+    ],
+)
+def test_round_trip(path, cipher_id, params):
+    chunk_count = write_container(path, MESSAGE, cipher_id, params, chunk_size=97)
+    with ContainerReader(path) as reader:
+        assert reader.chunk_count == chunk_count == -(-len(FORMATTED_MESSAGE) // 97)
+        assert reader.decrypt() == FORMATTED_MESSAGE
+        with ThreadPoolExecutor() as executor:
+            assert reader.decrypt(executor) == FORMATTED_MESSAGE
+        reader.verify()
+
+
+def test_vigenere_chunks_continue_the_key(path):
+    write_container(path, MESSAGE, VIGENERE, {"key": "LEMON"}, chunk_size=97)
+    with ContainerReader(path) as reader:
+        ciphertext = b"".join(
+            reader.read_chunk(index) for index in range(reader.chunk_count)
+        )
+    assert ciphertext.decode() == encrypt_vigenere(MESSAGE, "LEMON")
+
+
+def test_decrypt_single_chunk(path):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3}, chunk_size=97)
+    with ContainerReader(path) as reader:
+        assert reader.decrypt_chunk(2) == FORMATTED_MESSAGE[194:291]
+
+
+def test_empty_message(path):
+    assert write_container(path, "", CAESAR_SHIFT, {"shifts": 3}) == 0
+    with ContainerReader(path) as reader:
+        assert reader.decrypt() == ""
+
+
+def test_corrupted_chunk(path):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3}, chunk_size=97)
+    with ContainerReader(path) as reader:
+        offset = reader._index[1][0]
+    _corrupt(path, offset)
+    with ContainerReader(path) as reader:
+        assert reader.decrypt_chunk(0) == FORMATTED_MESSAGE[:97]
+        with pytest.raises(ContainerIntegrityError):
+            reader.read_chunk(1)
+        with pytest.raises(ContainerIntegrityError):
+            reader.verify()
+
+
+@pytest.mark.parametrize("footer_offset", [-5, -48, -60, -80])
+def test_corrupted_index_or_footer(path, footer_offset):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3}, chunk_size=97)
+    with open(path, "rb") as file:
+        size = file.seek(0, 2)
+    _corrupt(path, size + footer_offset)
+    with pytest.raises(ContainerIntegrityError):
+        ContainerReader(path)
+
+
+def test_chunk_past_index_is_rejected(path):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3}, chunk_size=97)
+    with open(path, "rb") as file:
+        data = bytearray(file.read())
+    # Rewrites the last chunk length with valid index and footer CRCs.
+    footer_offset = len(data) - 56
+    index_offset, chunk_count, _, tag = struct.unpack_from(
+        "<QII32s", data, footer_offset
+    )
+    struct.pack_into("<I", data, footer_offset - 8, 1 << 20)
+    index_crc = zlib.crc32(data[index_offset:footer_offset])
+    footer = struct.pack("<QII32s", index_offset, chunk_count, index_crc, tag)
+    data[footer_offset:] = footer + struct.pack("<I4s", zlib.crc32(footer), b"JCPE")
+    with open(path, "wb") as file:
+        file.write(data)
+    with pytest.raises(ContainerIntegrityError, match="out of bounds"):
+        ContainerReader(path)
+
+
+def test_corrupted_header(path):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3})
+    _corrupt(path, 10)
+    with pytest.raises(ContainerIntegrityError):
+        ContainerReader(path)
+
+
+def test_truncated_files(path):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3}, chunk_size=97)
+    with open(path, "rb") as file:
+        data = file.read()
+    for length in range(len(data)):
+        with open(path, "wb") as file:
+            file.write(data[:length])
+        with pytest.raises(ContainerFormatError):
+            ContainerReader(path)
+
+
+def test_authentication(path):
+    write_container(path, MESSAGE, CAESAR_SHIFT, {"shifts": 3}, auth_key=b"secret")
+    with ContainerReader(path) as reader:
+        reader.verify(b"secret")
+        with pytest.raises(ContainerIntegrityError):
+            reader.verify(b"wrong")
+
+
+@pytest.mark.parametrize(
+    "chunk_size, params",
+    [
+        (0, {"shifts": 3}),
+        (-1, {"shifts": 3}),
+        (1 << 32, {"shifts": 3}),
+        (97, {"shifts": 3, "padding": "A" * 0x10000}),
+    ],
+)
+def test_write_container_rejects_invalid_arguments(path, chunk_size, params):
+    with pytest.raises(ValueError):
+        write_container(path, MESSAGE, CAESAR_SHIFT, params, chunk_size=chunk_size)
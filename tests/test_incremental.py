@@ -0,0 +1,88 @@
+import random
+import string
+
+import pytest
+
+from jciphers.helper import UnsupportedKeyError
+from jciphers.incremental import (
+    encrypt_caesar_shift_incremental,
+    encrypt_rail_fence_incremental,
+    encrypt_vigenere_incremental,
+)
+from jciphers.substitution import encrypt_caesar_shift, encrypt_vigenere
+from jciphers.transposition import encrypt_rail_fence
+
+
+def _random_message(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_uppercase, k=length))
+
+
+def _edits(rng: random.Random, message: str):
+    """Yields a sequence of edited, truncated and appended documents."""
+    for _ in range(40):
+        operation = rng.choice(["edit", "truncate", "append", "insert"])
+        if operation == "edit" and message:
+            index = rng.randrange(len(message))
+            message = (
+                message[:index]
+                + rng.choice(string.ascii_uppercase)
+                + message[index + 1 :]
+            )
+        elif operation == "truncate":
+            message = message[: rng.randint(0, len(message))]
+        elif operation == "append":
+            message += _random_message(rng, rng.randint(1, 300))
+        else:
+            index = rng.randint(0, len(message))
+            message = message[:index] + _random_message(rng, 3) + message[index:]
+        yield message
+
+
+@pytest.mark.parametrize("levels", [2, 3, 7])
+def test_rail_fence_incremental_matches_full_encryption(levels):
+    rng = random.Random(levels)
+    state = None
+    for message in _edits(rng, _random_message(rng, 1000)):
+        encrypted_message, state = encrypt_rail_fence_incremental(
+            message, levels, state
+        )
+        assert encrypted_message == encrypt_rail_fence(message, levels)
+
+
+def test_rail_fence_edit_recomputes_only_its_rail():
+    message = _random_message(random.Random(0), 1000)
+    _, state = encrypt_rail_fence_incremental(message, 5)
+    rails = list(state.rails)
+    edited_message = (
+        message[:500] + ("A" if message[500] != "A" else "B") + message[501:]
+    )
+    encrypted_message, state = encrypt_rail_fence_incremental(edited_message, 5, state)
+    assert encrypted_message == encrypt_rail_fence(edited_message, 5)
+    for rail in range(5):
+        assert (state.rails[rail] is rails[rail]) == (rail != 500 % 5)
+
+
+def test_substitution_incremental_matches_full_encryption():
+    rng = random.Random(1)
+    caesar_state = vigenere_state = None
+    for message in _edits(rng, _random_message(rng, 1000)):
+        encrypted_message, caesar_state = encrypt_caesar_shift_incremental(
+            message, 7, caesar_state, block_size=64
+        )
+        assert encrypted_message == encrypt_caesar_shift(message, 7)
+        encrypted_message, vigenere_state = encrypt_vigenere_incremental(
+            message, "LEMON", vigenere_state, block_size=64
+        )
+        assert encrypted_message == encrypt_vigenere(message, "LEMON")
+
+
+@pytest.mark.parametrize("key", ["", "LE-MON"])
+def test_vigenere_incremental_rejects_invalid_keys(key):
+    with pytest.raises(UnsupportedKeyError):
+        encrypt_vigenere_incremental("ABC", key)
+
+
+@pytest.mark.parametrize("shifts", [0, 26])
+def test_caesar_shift_incremental_rejects_invalid_shifts(shifts):
+    with pytest.raises(IndexError):
+        encrypt_caesar_shift_incremental("", shifts)
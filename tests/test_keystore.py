@@ -0,0 +1,85 @@
+import string
+from collections import Counter
+
+import pytest
+
+from jciphers.keystore import MlecchitaKeyStore
+from jciphers.substitution import decrypt_mlecchita_vikaalpa_roman
+
+ALPHABET = sorted(string.ascii_uppercase)
+
+
+def test_rows_are_permutations():
+    store = MlecchitaKeyStore.generate(1000)
+    assert len(store) == 1000
+    for record_id in range(len(store)):
+        assert sorted(store.cipher_alphabet(record_id)) == ALPHABET
+
+
+def test_first_letters_are_roughly_uniform():
+    store = MlecchitaKeyStore.generate(26 * 400, seed=0)
+    counts = Counter(store.cipher_alphabet(index)[0] for index in range(len(store)))
+    assert len(counts) == 26
+    assert all(300 < count < 500 for count in counts.values())
+
+
+def test_seed_reproducibility():
+    first = MlecchitaKeyStore.generate(100, seed=7)
+    second = MlecchitaKeyStore.generate(100, seed=7)
+    other = MlecchitaKeyStore.generate(100, seed=8)
+    alphabets = [first.cipher_alphabet(index) for index in range(100)]
+    assert alphabets == [second.cipher_alphabet(index) for index in range(100)]
+    assert alphabets != [other.cipher_alphabet(index) for index in range(100)]
+
+
+def test_memory_mapped_round_trip(tmp_path):
+    path = str(tmp_path / "keys.bin")
+    # More records than one generation batch.
+    count = (1 << 14) + 5
+    in_memory = MlecchitaKeyStore.generate(count, seed=3)
+    with MlecchitaKeyStore.generate(count, seed=3, path=path) as mapped:
+        assert len(mapped) == count
+        for record_id in (0, 1 << 14, count - 1):
+            assert mapped.cipher_alphabet(record_id) == in_memory.cipher_alphabet(
+                record_id
+            )
+    with MlecchitaKeyStore.open(path) as reopened:
+        assert reopened.cipher_alphabet(count - 1) == in_memory.cipher_alphabet(
+            count - 1
+        )
+
+
+def test_tables_match_cipher_functions():
+    store = MlecchitaKeyStore.generate(1, seed=0)
+    encrypted_message = b"ATTACKATDAWN".translate(store.forward_table(0)).decode()
+    assert (
+        decrypt_mlecchita_vikaalpa_roman(encrypted_message, store.cipher_alphabet(0))
+        == "ATTACKATDAWN"
+    )
+    assert encrypted_message.encode().translate(store.inverse_table(0)) == (
+        b"ATTACKATDAWN"
+    )
+    with pytest.raises(IndexError):
+        store.cipher_alphabet(1)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        string.ascii_uppercase.encode()[:-1],
+        b"A" + string.ascii_uppercase.encode()[1:-1] + b"A",
+        string.ascii_uppercase.encode()[:-1] + b"-",
+    ],
+)
+def test_open_rejects_invalid_rows(tmp_path, data):
+    path = tmp_path / "keys.bin"
+    path.write_bytes(string.ascii_uppercase.encode() * 3 + data)
+    with pytest.raises(ValueError):
+        MlecchitaKeyStore.open(str(path))
+
+
+def test_open_empty_file(tmp_path):
+    path = tmp_path / "keys.bin"
+    path.write_bytes(b"")
+    with MlecchitaKeyStore.open(str(path)) as store:
+        assert len(store) == 0
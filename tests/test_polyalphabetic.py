@@ -0,0 +1,95 @@
+import random
+import string
+
+import pytest
+
+from jciphers.helper import UnsupportedKeyError, UnsupportedMessageError
+from jciphers.polyalphabetic import (
+    KeySchedule,
+    decrypt_autokey,
+    decrypt_beaufort,
+    decrypt_running_key,
+    decrypt_standard_vigenere,
+    decrypt_variant_beaufort,
+    encrypt_autokey,
+    encrypt_beaufort,
+    encrypt_running_key,
+    encrypt_standard_vigenere,
+    encrypt_variant_beaufort,
+)
+from jciphers.substitution import (
+    decrypt_vigenere,
+    encrypt_vigenere,
+    encrypt_vigenere_into,
+)
+
+CIPHERS = [
+    (encrypt_standard_vigenere, decrypt_standard_vigenere),
+    (encrypt_beaufort, decrypt_beaufort),
+    (encrypt_variant_beaufort, decrypt_variant_beaufort),
+    (encrypt_autokey, decrypt_autokey),
+]
+
+
+@pytest.mark.parametrize(
+    "encrypt, message, key, encrypted_message",
+    [
+        (encrypt_standard_vigenere, "attack at dawn", "LEMON", "LXFOPVEFRNHR"),
+        (
+            encrypt_beaufort,
+            "DEFEND THE EAST WALL OF THE CASTLE",
+            "FORTIFICATION",
+            "CKMPVCPVWPIWUJOGIUAPVWRIWUUK",
+        ),
+        (encrypt_variant_beaufort, "ATTACKATDAWN", "LEMON", "PPHMPZWHPNLJ"),
+        (encrypt_autokey, "ATTACKATDAWN", "QUEENLY", "QNXEPVYTWTWP"),
+        (encrypt_vigenere, "ATTACKATDAWN", "LEMON", "MYGPQWFGSOIS"),
+    ],
+)
+def test_known_answers(encrypt, message, key, encrypted_message):
+    assert encrypt(message, key) == encrypted_message
+
+
+@pytest.mark.parametrize("encrypt, decrypt", CIPHERS)
+def test_round_trip(encrypt, decrypt):
+    rng = random.Random(0)
+    for _ in range(20):
+        message = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(0, 200)))
+        key = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 12)))
+        assert decrypt(encrypt(message, key), key) == message
+
+
+def test_vigenere_round_trip_with_key_offset():
+    schedule = KeySchedule("LEMON", offset=1)
+    encrypted_message = encrypt_standard_vigenere("ATTACKATDAWN", schedule)
+    assert encrypted_message == encrypt_vigenere("ATTACKATDAWN", "LEMON")
+    assert decrypt_vigenere(encrypted_message, "LEMON") == "ATTACKATDAWN"
+
+
+def test_running_key_round_trip(tmp_path):
+    key_path = tmp_path / "key.txt"
+    key_path.write_text("It was the best of times,\nit was the worst of times.")
+    encrypted_message = encrypt_running_key("attack at dawn", str(key_path))
+    assert encrypted_message == encrypt_standard_vigenere(
+        "ATTACKATDAWN", "ITWASTHEBEST"
+    )
+    assert decrypt_running_key(encrypted_message, str(key_path)) == "ATTACKATDAWN"
+    with pytest.raises(UnsupportedKeyError):
+        encrypt_running_key("A" * 100, str(key_path))
+
+
+@pytest.mark.parametrize("key", ["", "LE-MON", "KEY1", "CLÉ"])
+def test_key_schedule_rejects_non_letters(key):
+    with pytest.raises(UnsupportedKeyError):
+        KeySchedule(key)
+
+
+@pytest.mark.parametrize("encrypt, _", CIPHERS + [(encrypt_vigenere, None)])
+def test_punctuation_error_has_a_message(encrypt, _):
+    with pytest.raises(UnsupportedMessageError, match="Unsupported character"):
+        encrypt("Hello, world!", "KEY")
+
+
+def test_buffer_punctuation_error_has_a_message():
+    with pytest.raises(UnsupportedMessageError, match="Unsupported byte"):
+        encrypt_vigenere_into(b"HELLO,WORLD", bytearray(11), "KEY")
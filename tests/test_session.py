@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import session
+from session import start_server
+
+ENCRYPTED_REPLY = b"Your encrypted message is: "
+
+
+async def _encrypt_caesar_shift(message: bytes, limit: int) -> list[bytes]:
+    """Encrypts a message with three shifts, then an over-long line, then again."""
+    server = await start_server("127.0.0.1", 0, limit=limit)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 24)
+        replies = []
+        # Substitution ciphers, Caesar Shift, Encrypt.
+        writer.write(b"2\n1\n1\n" + message + b"\n3\n")
+        await reader.readuntil(ENCRYPTED_REPLY)
+        replies.append(await reader.readline())
+        # Continue, Encrypt, then a line longer than the limit.
+        writer.write(b"1\n1\n" + b"A" * (limit + 1) + b"\n")
+        replies.append(await reader.readuntil(b"server allows.\n"))
+        writer.write(b"1\nABC\n3\n")
+        await reader.readuntil(ENCRYPTED_REPLY)
+        replies.append(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+    return replies
+
+
+def test_session_encrypts_messages_longer_than_64_kib():
+    message = b"A" * (1 << 17)
+    replies = asyncio.run(_encrypt_caesar_shift(message, limit=1 << 18))
+    assert replies[0] == b"D" * len(message) + b"\n"
+    assert replies[2] == b"DEF\n"
+
+
+def test_session_skips_lines_longer_than_the_limit():
+    replies = asyncio.run(_encrypt_caesar_shift(b"XYZ", limit=1 << 10))
+    assert replies[0] == b"ABC\n"
+    assert replies[1].endswith(b"The input line is longer than the server allows.\n")
+    assert replies[2] == b"DEF\n"
+
+
+async def _reply_during_validation(validation_started, release_validation):
+    server = await start_server("127.0.0.1", 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        other_reader, other_writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"2\n1\n1\nHELLO\n3\n")
+        loop = asyncio.get_running_loop()
+        assert await loop.run_in_executor(None, validation_started.wait, 5)
+        # The second session still answers while the first message is validated.
+        await asyncio.wait_for(other_reader.readuntil(b"> "), 5)
+        other_writer.write(b"2\n")
+        reply = await asyncio.wait_for(other_reader.readuntil(b"> "), 5)
+        release_validation.set()
+        await reader.readuntil(ENCRYPTED_REPLY)
+        encrypted_message = await reader.readline()
+        for stream_writer in (writer, other_writer):
+            stream_writer.close()
+            await stream_writer.wait_closed()
+    return reply, encrypted_message
+
+
+def test_validation_does_not_block_other_sessions(monkeypatch):
+    validation_started = threading.Event()
+    release_validation = threading.Event()
+    validate_message = session.validate_message
+    released = []
+
+    def slow_validate_message(message):
+        validation_started.set()
+        # Blocks the event loop for good if validation runs on it.
+        released.append(release_validation.wait(2))
+        validate_message(message)
+
+    monkeypatch.setattr(session, "validate_message", slow_validate_message)
+    reply, encrypted_message = asyncio.run(
+        _reply_during_validation(validation_started, release_validation)
+    )
+    assert released == [True]
+    assert b"Choose a substitution cipher:" in reply
+    assert encrypted_message == b"KHOOR\n"
@@ -0,0 +1,39 @@
+import pytest
+
+from jciphers.substitution import (
+    decrypt_mlecchita_vikaalpa_roman,
+    encrypt_caesar_shift,
+    encrypt_caesar_shift_into,
+    encrypt_mlecchita_vikaalpa_roman,
+)
+
+
+def test_mlecchita_vikaalpa_roman_round_trip():
+    encrypted_message, cipher_alphabet = encrypt_mlecchita_vikaalpa_roman(
+        "attack at dawn"
+    )
+    assert sorted(cipher_alphabet) == sorted("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    assert (
+        decrypt_mlecchita_vikaalpa_roman(encrypted_message, cipher_alphabet)
+        == "ATTACKATDAWN"
+    )
+
+
+def test_translate_into_in_place():
+    buffer = bytearray(b"ATTACKATDAWN")
+    encrypt_caesar_shift_into(buffer, buffer, 3)
+    assert buffer.decode() == encrypt_caesar_shift("ATTACKATDAWN", 3)
+
+
+def test_translate_into_disjoint_views_of_one_buffer():
+    buffer = bytearray(b"ABC" + bytes(3))
+    with memoryview(buffer) as view:
+        encrypt_caesar_shift_into(view[:3], view[3:], 3)
+    assert buffer == b"ABCDEF"
+
+
+def test_translate_into_rejects_partial_overlap():
+    buffer = bytearray(b"ATTACKATDAWN")
+    with memoryview(buffer) as view:
+        with pytest.raises(ValueError):
+            encrypt_caesar_shift_into(view[:8], view[2:10], 3)
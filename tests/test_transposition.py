@@ -0,0 +1,53 @@
+import pytest
+
+from jciphers.transposition import (
+    decrypt_rail_fence,
+    decrypt_rail_fence_into,
+    encrypt_rail_fence,
+    encrypt_rail_fence_into,
+)
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3, 5, 40])
+def test_rail_fence_into_matches_string_functions(levels):
+    message = b"WEAREDISCOVEREDFLEEATONCE"
+    encrypted_message = bytearray(len(message))
+    assert encrypt_rail_fence_into(message, encrypted_message, levels) == len(message)
+    assert encrypted_message.decode() == encrypt_rail_fence(message.decode(), levels)
+    decrypted_message = bytearray(len(message))
+    decrypt_rail_fence_into(encrypted_message, decrypted_message, levels)
+    assert decrypted_message == message
+    assert decrypt_rail_fence(encrypted_message.decode(), levels) == message.decode()
+
+
+@pytest.mark.parametrize("function", [encrypt_rail_fence_into, decrypt_rail_fence_into])
+@pytest.mark.parametrize("levels", [0, -1])
+def test_rail_fence_into_rejects_levels_below_one(function, levels):
+    with pytest.raises(ValueError):
+        function(b"MESSAGE", bytearray(7), levels)
+
+
+@pytest.mark.parametrize("function", [encrypt_rail_fence_into, decrypt_rail_fence_into])
+def test_rail_fence_into_rejects_invalid_buffers(function):
+    with pytest.raises(ValueError):
+        function(b"MESSAGE", bytearray(6), 2)
+    buffer = bytearray(b"MESSAGE")
+    with pytest.raises(ValueError):
+        function(buffer, buffer, 2)
+
+
+def test_rail_fence_into_accepts_disjoint_views_of_one_buffer():
+    buffer = bytearray(b"ABCD" + bytes(4))
+    with memoryview(buffer) as view:
+        encrypt_rail_fence_into(view[:4], view[4:], 2)
+    assert buffer == b"ABCDACBD"
+
+
+@pytest.mark.parametrize("function", [encrypt_rail_fence_into, decrypt_rail_fence_into])
+def test_rail_fence_into_rejects_overlapping_views(function):
+    buffer = bytearray(b"MESSAGE" + bytes(4))
+    with memoryview(buffer) as view:
+        with pytest.raises(ValueError):
+            function(view[:7], view[4:], 2)
+        with pytest.raises(ValueError):
+            function(view[:7].toreadonly(), view[:7], 2)
@@ -0,0 +1,54 @@
+import string
+
+import pytest
+
+from jciphers import verification
+from jciphers.substitution import _build_caesar_cipher_key
+from jciphers.verification import BackendMismatchError, run_differential
+
+
+@pytest.mark.parametrize(
+    "key, cipher_key",
+    [
+        ("ZEBRA", "ZEBRACDFGHIJKLMNOPQSTUVWXY"),
+        ("ZEBRAS", "ZEBRASTUVWXYCDFGHIJKLMNOPQ"),
+        (string.ascii_uppercase, string.ascii_uppercase),
+        ("", string.ascii_uppercase),
+    ],
+)
+def test_build_caesar_cipher_key(key, cipher_key):
+    assert _build_caesar_cipher_key(key) == cipher_key
+
+
+def test_run_differential_covers_every_backend():
+    results = run_differential(seed=0, samples=5, max_length=300)
+    backends = {(result.cipher, result.backend) for result in results}
+    assert ("Mlecchita Vikaalpa (Roman)", "buffer encrypt") in backends
+    assert ("Mlecchita Vikaalpa (Roman)", "unseeded encrypt") in backends
+    assert ("Rail fence", "incremental encrypt") in backends
+    assert ("Vigenère", "chunked parallel decrypt") in backends
+    assert ("Vigenère", "string encrypt") in backends
+    for cipher in ("Beaufort", "Variant Beaufort", "Autokey", "Running key"):
+        assert (cipher, "reference decrypt") in backends
+    assert all(result.characters > 0 for result in results)
+
+
+def test_run_differential_is_reproducible():
+    first = run_differential(seed=3, samples=2, max_length=100)
+    second = run_differential(seed=3, samples=2, max_length=100)
+    assert [result.characters for result in first] == [
+        result.characters for result in second
+    ]
+
+
+def test_run_differential_reports_mismatches(monkeypatch):
+    cipher_specs = verification._cipher_specs
+
+    def broken_cipher_specs(max_length, executor):
+        specs = cipher_specs(max_length, executor)
+        specs[0].encrypt_backends["buffer"] = lambda message, key, _: message[::-1]
+        return specs
+
+    monkeypatch.setattr(verification, "_cipher_specs", broken_cipher_specs)
+    with pytest.raises(BackendMismatchError):
+        run_differential(seed=0, samples=5, max_length=300)
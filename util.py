@@ -3,6 +3,7 @@ import os
 import string
 
 __all__ = [
+    "banner",
     "option_selection",
     "terminal_clear",
     "validate_message",
@@ -10,6 +11,11 @@ __all__ = [
 from jciphers.helper import UnsupportedKeyError, UnsupportedMessageError
 
 
+def banner(title: str) -> str:
+    border = "=" * len(title)
+    return f"{border}\n{title}\n{border}\n"
+
+
 def option_selection(prompt: str, options: list) -> int:
     selection = prompt + "\n"
     for index, choice in enumerate(options):
@@ -37,14 +43,12 @@ def validate_key(key: str) -> None:
         if char in string.punctuation:
             continue
         if char in string.digits:
-            print("Numbers are not supported in your key.")
-            raise UnsupportedKeyError()
+            raise UnsupportedKeyError("Numbers are not supported in your key.")
         upper_char_ord = ord(char.upper())
         if upper_char_ord < 65 or upper_char_ord > 90:
-            print(
+            raise UnsupportedKeyError(
                 f"Unsupported character in key: {char}. Only Latin characters are supported at this time."
             )
-            raise UnsupportedKeyError()
 
 
 def validate_message(message: str) -> None:
@@ -54,11 +58,9 @@ def validate_message(message: str) -> None:
         if char in string.punctuation:
             continue
         if char in string.digits:
-            print("Numbers are not supported in your message.")
-            raise UnsupportedMessageError()
+            raise UnsupportedMessageError("Numbers are not supported in your message.")
         upper_char_ord = ord(char.upper())
         if upper_char_ord < 65 or upper_char_ord > 90:
-            print(
+            raise UnsupportedMessageError(
                 f"Unsupported character in message: {char}. Only Latin characters are supported at this time."
             )
-            raise UnsupportedMessageError()